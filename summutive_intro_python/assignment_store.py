@@ -0,0 +1,103 @@
+from array import array
+
+from test2 import Assignment
+
+CATEGORIES = ("FA", "SA")  # Category code -> category
+CATEGORY_CODES = {"FA": 0, "SA": 1}
+NO_CATEGORY = 255  # Code for a category normalize_category rejected
+
+
+# View of one stored record with the same attributes as Assignment
+# Views index into the store, so the ones taken before a removal no longer point at their record
+class StoredAssignment:
+    __slots__ = ("store", "index")
+
+    def __init__(self, store, index):
+        self.store = store
+        self.index = index
+
+    @property
+    def name(self):
+        return self.store.names[self.store.name_ids[self.index]]
+
+    @property
+    def ass_cat(self):
+        code = self.store.categories[self.index]
+        return None if code == NO_CATEGORY else CATEGORIES[code]
+
+    # Takes a normalized category ("FA", "SA" or None), as assigned by StudentCalculatorGrade.update_assignment
+    @ass_cat.setter
+    def ass_cat(self, category):
+        self.store.categories[self.index] = NO_CATEGORY if category is None else CATEGORY_CODES[category]
+
+    @property
+    def weight(self):
+        return self.store.weights[self.index]
+
+    @weight.setter
+    def weight(self, weight):
+        self.store.weights[self.index] = weight
+
+    @property
+    def grade(self):
+        return self.store.grades[self.index]
+
+    @grade.setter
+    def grade(self, grade):
+        self.store.grades[self.index] = grade
+
+    # Calculate the weighted score for the assignment
+    def weighted_score(self):
+        return (self.weight * self.grade) / 100
+
+
+# Assignments kept in parallel typed arrays: 4-byte name id, 1-byte category, two 8-byte floats
+class AssignmentStore:
+    def __init__(self):
+        self.names = []  # Name id -> name, each distinct name is stored once
+        self.name_index = {}  # Name -> name id
+        self.name_ids = array("I")
+        self.categories = array("B")
+        self.weights = array("d")
+        self.grades = array("d")
+
+    def __len__(self):
+        return len(self.weights)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("assignment index out of range")
+        return StoredAssignment(self, index)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield StoredAssignment(self, index)
+
+    # Store a record from its fields, normalizing the category like Assignment does
+    def add(self, ass_name, ass_cat, weight, grade):
+        name_id = self.name_index.get(ass_name)
+        if name_id is None:
+            name_id = self.name_index[ass_name] = len(self.names)
+            self.names.append(ass_name)
+        category = Assignment.normalize_category(ass_cat)
+        self.name_ids.append(name_id)
+        self.categories.append(NO_CATEGORY if category is None else CATEGORY_CODES[category])
+        self.weights.append(weight)
+        self.grades.append(grade)
+        return len(self) - 1
+
+    # Accept Assignment objects so the store can replace a calculator's assignments list
+    def append(self, assignment):
+        self.add(assignment.name, assignment.ass_cat or "", assignment.weight, assignment.grade)
+
+    # Delete the record behind a StoredAssignment, like list.remove (names stay interned)
+    def remove(self, assignment):
+        if not isinstance(assignment, StoredAssignment) or assignment.store is not self:
+            raise ValueError("assignment is not in this store")
+        index = assignment.index
+        del self.name_ids[index]
+        del self.categories[index]
+        del self.weights[index]
+        del self.grades[index]
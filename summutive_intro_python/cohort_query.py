@@ -0,0 +1,85 @@
+from collections import namedtuple
+
+from cohort_rank import SortedGrades
+from test2 import Assignment
+
+# One indexed assignment, returned by every query
+AssignmentRecord = namedtuple("AssignmentRecord", ["class_name", "student_name", "ass_name", "ass_cat", "grade", "weight"])
+
+RESUBMISSION_THRESHOLD = 50  # Formative assignments under this can be resubmitted (test1.Student)
+
+
+# Secondary indexes on grade, one per (class_name, category), for threshold queries across cohorts
+class CohortQueryIndex:
+    def __init__(self):
+        self.indexes = {}  # (class_name, category) -> SortedGrades of (grade, student, assignment, weight)
+
+    # Index one assignment, the category may be written any way normalize_category accepts
+    def add(self, class_name, student_name, ass_name, ass_cat, grade, weight):
+        category = Assignment.normalize_category(ass_cat)
+        if category is None:
+            print("⚠️", f"Skipping '{ass_name}' of {student_name}: invalid category.")
+            return
+        key = (class_name, category)
+        index = self.indexes.get(key)
+        if index is None:
+            index = self.indexes[key] = SortedGrades()
+        index.add((grade, student_name, ass_name, weight))
+
+    # Take an assignment back out of the index (e.g. before its grade is changed)
+    def remove(self, class_name, student_name, ass_name, ass_cat, grade, weight):
+        self.indexes[(class_name, Assignment.normalize_category(ass_cat))].remove((grade, student_name, ass_name, weight))
+
+    # Index every assignment of a StudentCalculatorGrade
+    def add_calculator(self, calculator):
+        for assignment in calculator.assignments:
+            self.add(calculator.class_name, calculator.student_name, assignment.name,
+                     assignment.ass_cat, assignment.grade, assignment.weight)
+
+    # Index every assignment of a test1.Student, which has no class of its own
+    def add_student(self, student, class_name=""):
+        for assignment in student.assignments:
+            self.add(class_name, student.name, assignment.name,
+                     assignment.assignment_type, assignment.score, assignment.weight)
+
+    # Index rows from gradebook_import.import_gradebook
+    def add_rows(self, rows):
+        for row in rows:
+            self.add(row.class_name, row.student_name, row.ass_name, row.ass_cat, row.grade, row.weight)
+
+    def matching_indexes(self, category, class_name):
+        category = Assignment.normalize_category(category)
+        if class_name is not None:
+            index = self.indexes.get((class_name, category))
+            return [(class_name, index)] if index is not None else []
+        return sorted((key[0], index) for key, index in self.indexes.items() if key[1] == category)
+
+    # Assignments of a category graded below threshold, in one cohort or (class_name=None) all of them
+    def below(self, category, threshold, class_name=None):
+        category_code = Assignment.normalize_category(category)
+        records = []
+        for cohort, index in self.matching_indexes(category, class_name):
+            for grade, student_name, ass_name, weight in index.iter_below((threshold,)):
+                records.append(AssignmentRecord(cohort, student_name, ass_name, category_code, grade, weight))
+        return records
+
+    # Assignments of a category graded at or above threshold
+    def at_or_above(self, category, threshold, class_name=None):
+        category_code = Assignment.normalize_category(category)
+        records = []
+        for cohort, index in self.matching_indexes(category, class_name):
+            for grade, student_name, ass_name, weight in index.iter_from((threshold,)):
+                records.append(AssignmentRecord(cohort, student_name, ass_name, category_code, grade, weight))
+        return records
+
+    # Formative assignments eligible for resubmission (same rule as test1.Student.resubmission_eligibility)
+    def resubmission_eligible(self, class_name=None):
+        return self.below("FA", RESUBMISSION_THRESHOLD, class_name)
+
+    # Students with a formative assignment under 50%, the case individual_lab warns about
+    # Returns {(class_name, student_name): [AssignmentRecord, ...]}
+    def at_risk_students(self, class_name=None, threshold=50):
+        students = {}
+        for record in self.below("FA", threshold, class_name):
+            students.setdefault((record.class_name, record.student_name), []).append(record)
+        return students
@@ -0,0 +1,189 @@
+import math
+from bisect import bisect_left, insort
+
+BUCKET_SIZE = 512  # Buckets are split when they grow past twice this size
+
+
+# Sorted multiset kept as a list of small sorted buckets plus a Fenwick tree of bucket sizes,
+# so inserts, removals and positional lookups are all O(log n) (plus a small bucket shift)
+class SortedGrades:
+    def __init__(self):
+        self.buckets = []  # Sorted lists of keys, e.g. (grade, student_name)
+        self.maxes = []  # Last key of each bucket
+        self.tree = [0]  # Fenwick tree over bucket sizes (1-based)
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def rebuild_tree(self):
+        tree = [0] * (len(self.buckets) + 1)
+        for i, bucket in enumerate(self.buckets, 1):
+            tree[i] += len(bucket)
+            parent = i + (i & -i)
+            if parent < len(tree):
+                tree[parent] += tree[i]
+        self.tree = tree
+
+    def tree_add(self, bucket_index, delta):
+        i = bucket_index + 1
+        while i < len(self.tree):
+            self.tree[i] += delta
+            i += i & -i
+
+    # Number of keys in the buckets before bucket_index
+    def tree_prefix(self, bucket_index):
+        total, i = 0, bucket_index
+        while i:
+            total += self.tree[i]
+            i -= i & -i
+        return total
+
+    def add(self, key):
+        if not self.buckets:
+            self.buckets.append([key])
+            self.maxes.append(key)
+            self.rebuild_tree()
+        else:
+            i = min(bisect_left(self.maxes, key), len(self.buckets) - 1)
+            bucket = self.buckets[i]
+            insort(bucket, key)
+            self.maxes[i] = bucket[-1]
+            if len(bucket) > 2 * BUCKET_SIZE:
+                self.buckets[i:i + 1] = [bucket[:BUCKET_SIZE], bucket[BUCKET_SIZE:]]
+                self.maxes[i:i + 1] = [bucket[BUCKET_SIZE - 1], bucket[-1]]
+                self.rebuild_tree()
+            else:
+                self.tree_add(i, 1)
+        self.size += 1
+
+    # Remove one copy of key, KeyError if it is not there
+    def remove(self, key):
+        i = bisect_left(self.maxes, key)
+        if i == len(self.buckets):
+            raise KeyError(key)
+        bucket = self.buckets[i]
+        pos = bisect_left(bucket, key)
+        if bucket[pos] != key:
+            raise KeyError(key)
+        del bucket[pos]
+        self.size -= 1
+        if bucket:
+            self.maxes[i] = bucket[-1]
+            self.tree_add(i, -1)
+        else:
+            del self.buckets[i]
+            del self.maxes[i]
+            self.rebuild_tree()
+
+    # Number of keys smaller than key
+    def count_below(self, key):
+        i = bisect_left(self.maxes, key)
+        if i == len(self.buckets):
+            return self.size
+        return self.tree_prefix(i) + bisect_left(self.buckets[i], key)
+
+    # Key at a 0-based position in ascending order
+    def at(self, position):
+        # Walk down the Fenwick tree to the bucket holding the position
+        bucket_index, step = 0, 1 << (len(self.tree) - 1).bit_length()
+        while step:
+            nxt = bucket_index + step
+            if nxt < len(self.tree) and self.tree[nxt] <= position:
+                bucket_index = nxt
+                position -= self.tree[nxt]
+            step >>= 1
+        return self.buckets[bucket_index][position]
+
+    # Keys smaller than key, from smallest up
+    def iter_below(self, key):
+        for bucket in self.buckets:
+            if bucket[-1] < key:
+                yield from bucket
+            else:
+                yield from bucket[:bisect_left(bucket, key)]
+                return
+
+    # Keys at or above key, from smallest up
+    def iter_from(self, key):
+        i = bisect_left(self.maxes, key)
+        if i == len(self.buckets):
+            return
+        bucket = self.buckets[i]
+        yield from bucket[bisect_left(bucket, key):]
+        for bucket in self.buckets[i + 1:]:
+            yield from bucket
+
+    # Keys from largest to smallest
+    def descending(self):
+        for bucket in reversed(self.buckets):
+            yield from reversed(bucket)
+
+
+# Rank, percentile and top-k index of final grades per class_name
+class CohortRankIndex:
+    def __init__(self):
+        self.cohorts = {}  # class_name -> SortedGrades
+        self.grades = {}  # (class_name, student_name) -> indexed grade
+
+    # Set (or change) a student's final grade, grade=None takes the student out of the index
+    def update(self, class_name, student_name, grade):
+        old = self.grades.pop((class_name, student_name), None)
+        if old is not None:
+            self.cohorts[class_name].remove((old, student_name))
+        if grade is not None:
+            self.cohorts.setdefault(class_name, SortedGrades()).add((grade, student_name))
+            self.grades[(class_name, student_name)] = grade
+
+    # Index a StudentCalculatorGrade from its calculate_fin_grade result
+    def update_from_calculator(self, calculator):
+        grade = None
+        if calculator.categories_present["FA"] and calculator.categories_present["SA"]:
+            grade = calculator.calculate_fin_grade()[0]
+        self.update(calculator.class_name, calculator.student_name, grade)
+
+    # Number of graded students in a cohort
+    def cohort_size(self, class_name):
+        cohort = self.cohorts.get(class_name)
+        return len(cohort) if cohort else 0
+
+    # 1-based position from the top, students with the same grade share a rank
+    def rank(self, class_name, student_name):
+        grade = self.grades.get((class_name, student_name))
+        if grade is None:
+            return None
+        cohort = self.cohorts[class_name]
+        # (g,) sorts before every (g, name) key, so this counts grades up to and including grade
+        return len(cohort) - cohort.count_below((math.nextafter(grade, math.inf),)) + 1
+
+    # Percentage of the cohort with a lower final grade
+    def percentile(self, class_name, student_name):
+        grade = self.grades.get((class_name, student_name))
+        if grade is None:
+            return None
+        cohort = self.cohorts[class_name]
+        return cohort.count_below((grade,)) / len(cohort) * 100
+
+    # The k best (student_name, grade) pairs of a cohort, best first
+    def top(self, class_name, k):
+        cohort = self.cohorts.get(class_name)
+        if not cohort:
+            return []
+        results = []
+        for grade, student_name in cohort.descending():
+            if len(results) == k:
+                break
+            results.append((student_name, grade))
+        return results
+
+    # Students in the top percent of a cohort, best first
+    def top_percent(self, class_name, percent):
+        return self.top(class_name, math.ceil(self.cohort_size(class_name) * percent / 100))
+
+    # Final grade at a given percentile of a cohort (0 = lowest, 100 = highest)
+    def grade_at_percentile(self, class_name, percent):
+        cohort = self.cohorts.get(class_name)
+        if not cohort:
+            return None
+        position = min(len(cohort) - 1, int(len(cohort) * percent / 100))
+        return cohort.at(position)[0]
@@ -0,0 +1,87 @@
+import io
+import sys
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from gradebook_import import import_gradebook
+from test2 import StudentCalculatorGrade
+from transcript_writer import TranscriptWriter, open_transcript_file
+
+# Grades of one student, as returned by calculate_fin_grade
+StudentResult = namedtuple("StudentResult", ["class_name", "student_name", "overall", "formative", "summative", "gpa"])
+# Everything produced for one class
+ClassReport = namedtuple("ClassReport", ["class_name", "results", "transcripts"])
+
+
+# Group gradebook rows by class, keeping each class's rows in file order
+def shard_by_class(rows):
+    shards = {}
+    for row in rows:
+        shards.setdefault(row.class_name, []).append((row.student_name, row.ass_name, row.ass_cat, row.weight, row.grade))
+    return shards
+
+
+# Grade one class and render its transcripts (runs inside a worker process)
+def grade_class(shard):
+    class_name, rows = shard
+    calculators = {}
+    for student_name, ass_name, ass_cat, weight, grade in rows:
+        calculator = calculators.get(student_name)
+        if calculator is None:
+            calculator = calculators[student_name] = StudentCalculatorGrade(student_name, class_name)
+        calculator.add_assignment(ass_name, ass_cat, weight, grade)
+
+    results = []
+    buffer = io.StringIO()
+    with TranscriptWriter(buffer) as writer:
+        for student_name in sorted(calculators):
+            calculator = calculators[student_name]
+            if calculator.categories_present["FA"] and calculator.categories_present["SA"]:
+                results.append(StudentResult(class_name, student_name, *calculator.calculate_fin_grade()))
+            else:
+                results.append(StudentResult(class_name, student_name, None, None, None, None))
+            writer.write(calculator)
+    return ClassReport(class_name, results, buffer.getvalue())
+
+
+# Grade every class over a process pool and return the reports ordered by class name
+def run_cohorts(rows, workers=None):
+    shards = shard_by_class(rows)
+    # Start the biggest classes first so one large class does not finish last on its own
+    jobs = sorted(shards.items(), key=lambda shard: -len(shard[1]))
+    if workers == 1:
+        reports = list(map(grade_class, jobs))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            reports = list(pool.map(grade_class, jobs))
+    reports.sort(key=lambda report: report.class_name)
+    return reports
+
+
+# Grade a whole institution from a gradebook file
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: cohort_runner.py GRADEBOOK [WORKERS] [TRANSCRIPTS_FILE]")
+        return
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else None
+
+    reports = run_cohorts(import_gradebook(sys.argv[1]), workers)
+
+    if len(sys.argv) > 3:
+        with open_transcript_file(sys.argv[3]) as file:
+            for report in reports:
+                file.write(report.transcripts)
+        print(f"Transcripts written to {sys.argv[3]}")
+    else:
+        for report in reports:
+            sys.stdout.write(report.transcripts)
+
+    print(f"\n{'Cohort':<20}{'Students':<10}{'Graded'}")
+    print("-" * 40)
+    for report in reports:
+        graded = sum(1 for result in report.results if result.overall is not None)
+        print(f"{report.class_name:<20}{len(report.results):<10}{graded}")
+
+
+if __name__ == "__main__":
+    main()
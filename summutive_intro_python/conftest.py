@@ -0,0 +1,41 @@
+import contextlib
+import io
+
+import pytest
+
+import gpa_scale
+import grade_batch
+import grade_scenario
+import plagiarism_vocab
+from test2 import StudentCalculatorGrade
+
+# Modules with an optional NumPy fast path; the "python" engine runs them with np = None
+NUMPY_MODULES = (gpa_scale, grade_batch, grade_scenario, plagiarism_vocab)
+
+
+@pytest.fixture(params=["numpy", "python"])
+def engine(request, monkeypatch):
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        for module in NUMPY_MODULES:
+            monkeypatch.setattr(module, "np", None)
+    return request.param
+
+
+# StudentCalculatorGrade objects with random assignments; weight() and grade() draw each value,
+# and every student gets between assignments[0] and assignments[1] add_assignment calls
+def make_calculators(rng, students, weight, grade, assignments=(0, 12)):
+    calculators = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for number in range(students):
+            calculator = StudentCalculatorGrade(f"Stü{number}", f"C{number % 5}")
+            for assignment in range(rng.randint(*assignments)):
+                calculator.add_assignment(f"a{assignment}", rng.choice(["FA", "SA"]), weight(), grade())
+            calculators.append(calculator)
+    return calculators
+
+
+@pytest.fixture
+def random_calculators():
+    return make_calculators
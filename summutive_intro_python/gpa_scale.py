@@ -0,0 +1,82 @@
+from array import array
+from bisect import bisect_right
+
+try:
+    import numpy as np  # Optional: vectorized fast path
+except ImportError:
+    np = None
+
+
+# GPA scale made of bands: a grade at or above cutoffs[i] (and below the next cutoff) earns points[i + 1]
+class StepScale:
+    def __init__(self, cutoffs, points):
+        if len(points) != len(cutoffs) + 1 or list(cutoffs) != sorted(cutoffs):
+            raise ValueError("Cutoffs must be ascending, with one more points value than cutoffs.")
+        self.cutoffs = tuple(cutoffs)
+        self.points = tuple(points)
+
+    # Convert one percentage grade to GPA
+    def convert(self, percentage):
+        return self.points[bisect_right(self.cutoffs, percentage)]
+
+    # Convert many percentage grades to GPA in one call
+    def convert_many(self, percentages):
+        cutoffs, points = self.cutoffs, self.points
+        if np is not None:
+            # side="right" is bisect_right: a grade on a cutoff earns the band above it
+            bands = np.searchsorted(cutoffs, np.asarray(percentages, dtype=np.float64), side="right")
+            return array("d", np.asarray(points, dtype=np.float64)[bands].tobytes())
+        return array("d", [points[bisect_right(cutoffs, percentage)] for percentage in percentages])
+
+    # Lowest percentage that earns at least this GPA (None if no band reaches it)
+    def min_percentage(self, gpa):
+        for i, points in enumerate(self.points):
+            if points >= gpa:
+                return self.cutoffs[i - 1] if i else float("-inf")
+        return None
+
+
+# GPA scale that maps 0-100% linearly onto 0-max_points, rounded to a number of digits
+class LinearScale:
+    def __init__(self, max_points, digits=2):
+        self.max_points = max_points
+        self.digits = digits
+
+    # Convert one percentage grade to GPA
+    def convert(self, percentage):
+        return round((percentage / 100) * self.max_points, self.digits)
+
+    # Convert many percentage grades to GPA in one call
+    def convert_many(self, percentages):
+        max_points, digits = self.max_points, self.digits
+        if np is not None and 0 <= digits <= 15:
+            return array("d", self.convert_many_numpy(np.asarray(percentages, dtype=np.float64)).tobytes())
+        return array("d", [round((percentage / 100) * max_points, digits) for percentage in percentages])
+
+    # NumPy path of convert_many: rint on the scaled values, with round() for the values np.rint may
+    # round the other way (within a few ulps of a half, where scaling by 10**digits was inexact)
+    def convert_many_numpy(self, percentages):
+        scale = 10.0 ** self.digits
+        with np.errstate(over="ignore", invalid="ignore"):
+            values = (percentages / 100) * self.max_points
+            scaled = values * scale
+            gpa = np.rint(scaled) / scale
+            unsure = np.abs(scaled - np.floor(scaled) - 0.5) <= 1e-6 + np.abs(scaled) * 1e-15
+            unsure |= np.isfinite(values) & ~(np.abs(scaled) < 2.0 ** 52)  # Past 2**52 the scaling itself is inexact
+        for index in np.flatnonzero(unsure):
+            gpa[index] = round(float(values[index]), self.digits)
+        return gpa
+
+    # Lowest percentage that earns at least this GPA (ignoring rounding, so it never undershoots)
+    def min_percentage(self, gpa):
+        if gpa > self.max_points:
+            return None
+        return gpa / self.max_points * 100
+
+
+# Scale of the lab-1 file and test2.py (out of 4.0)
+FOUR_POINT_SCALE = StepScale([40, 50, 65, 75, 85], [0.0, 2.0, 2.5, 3.0, 3.5, 4.0])
+# Scale of test1.py (out of 5.0)
+FIVE_POINT_SCALE = StepScale([40, 50, 65, 75, 85], [0.0, 1.0, 2.0, 3.0, 4.0, 5.0])
+# Scale of indivi.py and individual_lab.py (linear, out of 5)
+LINEAR_FIVE_POINT_SCALE = LinearScale(5)
@@ -0,0 +1,208 @@
+import math
+from array import array
+from bisect import bisect_left
+from collections import namedtuple
+from itertools import compress, islice, repeat
+from operator import le, mul, truediv
+
+from gpa_scale import FOUR_POINT_SCALE
+
+try:
+    import numpy as np  # Optional: vectorized fast path
+except ImportError:
+    np = None
+
+FA, SA = 0, 1  # Category codes used in the category column
+CATEGORY_CODES = {"FA": FA, "SA": SA}
+FLIP = bytes([SA, FA]) + bytes(254)  # bytes.translate table turning an SA mask into an FA mask
+CHUNK_ROWS = 1 << 20  # Rows per block on the NumPy path, so temporaries stay bounded on huge inputs
+MAX_LEVELS = 40  # Bit levels tried per block on the NumPy path before falling back to math.fsum
+
+# Columnar results, one entry per student id (NaN where a category is missing)
+CohortGrades = namedtuple("CohortGrades", ["overall", "formative", "summative", "gpa"])
+
+
+# Turn a list of StudentCalculatorGrade objects into the four input columns
+def columns_from_calculators(calculators):
+    student_ids, categories, weights, grades = array("I"), array("B"), array("d"), array("d")
+    for student_id, calculator in enumerate(calculators):
+        for assignment in calculator.assignments:
+            student_ids.append(student_id)
+            categories.append(CATEGORY_CODES[assignment.ass_cat])
+            weights.append(assignment.weight)
+            grades.append(assignment.grade)
+    return student_ids, categories, weights, grades
+
+
+# Grade every student of a cohort with segment sums over the columns
+def calculate_cohort_grades(student_ids, categories, weights, grades, num_students=None, scale=FOUR_POINT_SCALE):
+    if num_students is None:
+        num_students = max(student_ids) + 1 if len(student_ids) else 0
+    if np is not None:
+        return cohort_grades_numpy(student_ids, categories, weights, grades, num_students, scale)
+
+    # Rows usually arrive grouped by student already; otherwise put them in student order
+    # (a stable sort, and the fsum totals below do not depend on row order anyway)
+    if not all(map(le, student_ids, islice(student_ids, 1, None))):
+        order = sorted(range(len(student_ids)), key=student_ids.__getitem__)
+        student_ids = array("I", map(student_ids.__getitem__, order))
+        categories = array("B", map(categories.__getitem__, order))
+        weights = array("d", map(weights.__getitem__, order))
+        grades = array("d", map(grades.__getitem__, order))
+
+    offsets = array("Q", [bisect_left(student_ids, student_id) for student_id in range(num_students)])
+    offsets.append(len(student_ids))
+    return segment_grades_python(offsets, categories, weights, grades, scale)
+
+
+# Grade students whose rows are contiguous: student i owns rows offsets[i]:offsets[i + 1]
+# The columns are only sliced (or viewed, with NumPy), so memoryviews over a mapped file are read in place
+def segment_grades(offsets, categories, weights, grades, scale=FOUR_POINT_SCALE):
+    if np is not None:
+        return segment_grades_numpy(np.asarray(offsets, dtype=np.int64), np.asarray(categories, dtype=np.uint8),
+                                    np.asarray(weights, dtype=np.float64), np.asarray(grades, dtype=np.float64), scale)
+    return segment_grades_python(offsets, categories, weights, grades, scale)
+
+
+# Pure-Python fallback, one math.fsum per total and student
+def segment_grades_python(offsets, categories, weights, grades, scale):
+    nan = float("nan")
+    overall, formative, summative, gpa = array("d"), array("d"), array("d"), array("d")
+    for start, end in zip(offsets, islice(offsets, 1, None)):
+        is_sa = bytes(categories[start:end])
+        sa_count = is_sa.count(SA)
+        if sa_count == 0 or sa_count == end - start:  # Missing FA or SA category
+            overall.append(nan)
+            formative.append(nan)
+            summative.append(nan)
+            gpa.append(nan)
+            continue
+        is_fa = is_sa.translate(FLIP)
+        slot_weights = weights[start:end]
+        scores = list(map(truediv, map(mul, slot_weights, grades[start:end]), repeat(100)))
+
+        # math.fsum gives the same correctly rounded totals as calculate_fin_grade
+        fa_weight = math.fsum(compress(slot_weights, is_fa))
+        sa_weight = math.fsum(compress(slot_weights, is_sa))
+        total_weight = math.fsum(slot_weights)
+        overall_grade = (math.fsum(scores) / total_weight) * 100 if total_weight > 0 else 0
+        overall.append(overall_grade)
+        formative.append((math.fsum(compress(scores, is_fa)) / fa_weight) * 100 if fa_weight > 0 else 0)
+        summative.append((math.fsum(compress(scores, is_sa)) / sa_weight) * 100 if sa_weight > 0 else 0)
+        gpa.append(scale.convert(overall_grade))
+
+    return CohortGrades(overall, formative, summative, gpa)
+
+
+# NumPy path: order the rows by student if needed, then grade the segments
+def cohort_grades_numpy(student_ids, categories, weights, grades, num_students, scale):
+    student_ids = np.asarray(student_ids, dtype=np.int64)
+    categories = np.asarray(categories, dtype=np.uint8)
+    weights = np.asarray(weights, dtype=np.float64)
+    grades = np.asarray(grades, dtype=np.float64)
+    if len(student_ids) > 1 and np.any(student_ids[1:] < student_ids[:-1]):
+        order = np.argsort(student_ids, kind="stable")
+        categories, weights, grades = categories[order], weights[order], grades[order]
+    offsets = np.zeros(num_students + 1, dtype=np.int64)
+    np.cumsum(np.bincount(student_ids, minlength=num_students), out=offsets[1:])
+    return segment_grades_numpy(offsets, categories, weights, grades, scale)
+
+
+# a + b as the rounded sum and its exact rounding error (TwoSum)
+def two_sum(a, b):
+    total = a + b
+    rounded = total - a
+    return total, (a - (total - rounded)) + (b - rounded)
+
+
+# Exact per-slot sums of values, as a list of levels whose own sums are exact: each level takes the
+# high bits of every value, cut at a power of two large enough that no partial sum of a slot can round,
+# and leaves the rest for the next level. Also returns the slots whose values ran past MAX_LEVELS.
+def exact_slot_sums(slots, values, num_slots, max_count):
+    levels = []
+    headroom = max(max_count, 1).bit_length() + 1
+    for _ in range(MAX_LEVELS):
+        largest = float(np.max(np.abs(values))) if len(values) else 0.0
+        if largest == 0:
+            return levels, np.zeros(num_slots, dtype=bool)
+        sigma = math.ldexp(1.0, math.frexp(largest)[1] + headroom)
+        high = (sigma + values) - sigma
+        levels.append(np.bincount(slots, weights=high, minlength=num_slots))
+        values = values - high
+    return levels, np.bincount(slots, weights=values != 0, minlength=num_slots) > 0
+
+
+# Round the exact sum of terms (arrays of exact partial sums) once, like math.fsum.
+# Returns the totals and a mask of those that could not be proven correctly rounded.
+def round_exact_sum(terms):
+    sums, errors = terms[0], np.zeros_like(terms[0])
+    inexact = np.zeros(len(sums), dtype=bool)
+    for term in terms[1:]:
+        sums, error = two_sum(sums, term)
+        errors, error = two_sum(errors, error)
+        inexact |= error != 0
+    totals = sums + errors
+    # Exact when the errors added up without rounding; otherwise they are off by at most
+    # len(terms) * u * |errors|, which only matters that close to half an ulp
+    remainder = (sums - totals) + errors
+    bound = len(terms) * 2.0 ** -52 * np.abs(errors) + 2.0 ** -1070
+    half_ulp = np.spacing(np.nextafter(totals, 0)) / 2
+    return totals, inexact & (np.abs(remainder) + bound >= half_ulp)
+
+
+# NumPy path: the same totals as math.fsum, from exact bit levels summed with np.bincount
+def segment_grades_numpy(offsets, categories, weights, grades, scale):
+    num_students = len(offsets) - 1
+    overall, formative, summative = (np.empty(num_students) for _ in range(3))
+    # Work through blocks of whole students so per-row temporaries stay around CHUNK_ROWS
+    first = 0
+    while first < num_students:
+        last = int(np.searchsorted(offsets, offsets[first] + CHUNK_ROWS, side="right")) - 1
+        last = min(max(last, first + 1), num_students)
+        start, end = int(offsets[first]), int(offsets[last])
+        block_categories = categories[start:end]
+        block_weights = weights[start:end]
+        scores = block_weights * grades[start:end] / 100
+        lengths = np.diff(offsets[first:last + 1])
+        slots = 2 * np.repeat(np.arange(last - first), lengths) + (block_categories == SA)  # (student, category)
+        slot_counts = np.bincount(slots, minlength=2 * (last - first))
+        fa_count, sa_count = slot_counts[0::2], slot_counts[1::2]
+
+        if np.all(np.isfinite(scores)):
+            totals, unsure = [], np.zeros(last - first, dtype=bool)
+            for values in (block_weights, scores):
+                levels, left_over = exact_slot_sums(slots, values, 2 * (last - first), int(slot_counts.max()))
+                levels = levels or [np.zeros(2 * (last - first))]
+                unsure |= left_over[0::2] | left_over[1::2]
+                for terms in ([level[0::2] for level in levels], [level[1::2] for level in levels],
+                              [level[0::2] for level in levels] + [level[1::2] for level in levels]):
+                    total, total_unsure = round_exact_sum(terms)
+                    totals.append(total)
+                    unsure |= total_unsure
+            fa_weight, sa_weight, total_weight, fa_score, sa_score, total_score = totals
+        else:
+            unsure = np.ones(last - first, dtype=bool)
+            fa_weight, sa_weight, total_weight, fa_score, sa_score, total_score = np.zeros((6, last - first))
+
+        # Students that could not be settled above (rare) are summed with math.fsum
+        for student in np.flatnonzero(unsure):
+            rows = slice(offsets[first + student] - start, offsets[first + student + 1] - start)
+            is_sa = block_categories[rows] == SA
+            for column, total in ((block_weights[rows], (fa_weight, sa_weight, total_weight)),
+                                  (scores[rows], (fa_score, sa_score, total_score))):
+                total[0][student] = math.fsum(column[~is_sa])
+                total[1][student] = math.fsum(column[is_sa])
+                total[2][student] = math.fsum(column)
+
+        missing = (fa_count == 0) | (sa_count == 0)  # Missing FA or SA category
+        with np.errstate(divide="ignore", invalid="ignore"):
+            block_overall = np.where(total_weight > 0, (total_score / total_weight) * 100, 0)
+            block_formative = np.where(fa_weight > 0, (fa_score / fa_weight) * 100, 0)
+            block_summative = np.where(sa_weight > 0, (sa_score / sa_weight) * 100, 0)
+        for block, column in ((block_overall, overall), (block_formative, formative), (block_summative, summative)):
+            block[missing] = np.nan
+            column[first:last] = block
+        first = last
+
+    gpa = np.where(np.isnan(overall), np.nan, np.frombuffer(scale.convert_many(overall), dtype=np.float64))
+    return CohortGrades(*(array("d", column.tobytes()) for column in (overall, formative, summative, gpa)))
@@ -0,0 +1,206 @@
+import argparse
+import contextlib
+import io
+import json
+import math
+import platform
+import random
+
+import indivi
+import individual_lab
+import test1
+import test2
+from plagiarism_bench import git_commit, measure
+
+FIELDS = ('overall', 'formative', 'summative', 'gpa', 'passed')
+REFERENCE = 'test2'  # Engine the others are compared against (same core as the lab-1 file)
+
+def generate_gradebook(students=1000, assignments=8, missing_rate=0.05, seed=42):
+    """Returns seeded synthetic students as lists of (name, category, weight, grade).
+
+    Formative weights add up to under 60 and summative weights to under 40, so every
+    engine (including test1's per-category caps) accepts the same rows.
+    """
+    rng = random.Random(seed)
+    gradebook = []
+    for _ in range(students):
+        categories = [rng.choice(('FA', 'SA')) for _ in range(assignments)]
+        if rng.random() < missing_rate:  # Some students only have one category
+            categories = [categories[0]] * assignments
+        rows = []
+        for category, limit in (('FA', 60), ('SA', 40)):
+            count = categories.count(category)
+            if not count:
+                continue
+            # Weights in hundredths, one short of the cap so float sums never creep over it
+            top = limit * 100 - 1
+            cuts = sorted(rng.randint(0, top) for _ in range(count - 1))
+            for number, (low, high) in enumerate(zip([0] + cuts, cuts + [top])):
+                rows.append((f"{category}{number + 1}", category, (high - low) / 100, round(rng.uniform(0, 100), 2)))
+        rng.shuffle(rows)
+        gradebook.append(rows)
+    return gradebook
+
+def build_test2(rows):
+    calculator = test2.StudentCalculatorGrade('student', 'cohort')
+    for row in rows:
+        calculator.add_assignment(*row)
+    return calculator
+
+def result_test2(calculator):
+    overall, formative, summative, gpa = calculator.calculate_fin_grade()
+    if overall is None:
+        return None
+    return overall, formative, summative, gpa, formative >= 50 and summative >= 50
+
+def build_indivi(rows):
+    calculator = indivi.StudentCalculateGrade()
+    for row in rows:
+        calculator.add_assignment(*row)
+    return calculator
+
+def result_indivi(calculator):
+    if not calculator.categories_present['FA'] or not calculator.categories_present['SA']:
+        return None  # show_results refuses to grade
+    overall, formative, summative = calculator.calculate_final_grade()
+    passed = calculator.deter_fail_pass(formative, summative) == 'Pass'
+    return overall, formative, summative, calculator.calc_gpa(overall), passed
+
+def build_individual_lab(rows):
+    calculator = individual_lab.StudentCalculatorGrade()
+    for row in rows:
+        calculator.add_assignment(*row)
+    return calculator
+
+def result_individual_lab(calculator):
+    overall, formative, summative = calculator.calculate_fin_grade()
+    if overall is None:
+        return None
+    passed = calculator.determine_pass_fail(formative, summative) == 'Pass'
+    return overall, formative, summative, calculator.calculate_gpa(overall), passed
+
+def build_test1(rows):
+    student = test1.Student('student')
+    for name, category, weight, grade in rows:
+        student.add_assignment(test1.Assignment(name, 'Formative' if category == 'FA' else 'Summative', grade, weight))
+    return student
+
+def result_test1(student):
+    formative_score, summative_score, overall, gpa, status = student.calculate_scores()
+    # test1 reports weighted points per category; turn them into percentages to compare
+    formative = formative_score / student.formative_total_weight * 100 if student.formative_total_weight else 0
+    summative = summative_score / student.summative_total_weight * 100 if student.summative_total_weight else 0
+    return overall, formative, summative, gpa, status == '✅ Passed'
+
+# name -> (build from rows, normalised result, print the engine's own report)
+ENGINES = {
+    'test2': (build_test2, result_test2, lambda calculator: calculator.show_results()),
+    'indivi': (build_indivi, result_indivi, lambda calculator: calculator.show_results()),
+    'individual_lab': (build_individual_lab, result_individual_lab, lambda calculator: calculator.show_results()),
+    'test1': (build_test1, result_test1, lambda student: student.generate_transcript()),
+}
+
+def safe_result(result, engine):
+    """Returns the normalised result, None when the engine declines, or the error it raised."""
+    try:
+        return result(engine)
+    except Exception as error:  # individual_lab raises on formative grades under 50
+        return f"{type(error).__name__}: {error}"
+
+def field_matches(a, b, tolerance):
+    if isinstance(a, bool) or isinstance(b, bool):
+        return a == b
+    return math.isclose(a, b, rel_tol=tolerance, abs_tol=tolerance)
+
+def compare(reference, other, tolerance):
+    """Returns the names of the fields where two normalised results differ."""
+    if isinstance(reference, tuple) and isinstance(other, tuple):
+        return [field for field, a, b in zip(FIELDS, reference, other) if not field_matches(a, b, tolerance)]
+    if reference is None and other is None:
+        return []
+    return ['error' if isinstance(other, str) else 'no result' if other is None else 'graded anyway']
+
+def run_benchmark(sizes=(100, 1000, 10000), assignments=8, missing_rate=0.05, seed=42, tolerance=1e-9, examples=3):
+    """Benchmarks every engine on gradebooks of increasing size and reports where they diverge."""
+    results, divergences = [], {}
+    for students in sizes:
+        gradebook = generate_gradebook(students, assignments, missing_rate, seed)
+        rows = students * assignments
+        outputs = {}
+        with contextlib.redirect_stdout(io.StringIO()):  # The engines print warnings and reports
+            for name, (build, result, report) in ENGINES.items():
+                engines, stats = measure('add', rows, 'assignments', lambda: [build(student) for student in gradebook])
+                results.append(dict(stats, engine=name, students=students))
+                outputs[name], stats = measure('compute', students, 'students', lambda: [
+                    safe_result(result, engine) for engine in engines
+                ])
+                results.append(dict(stats, engine=name, students=students))
+
+                def render():
+                    for engine in engines:
+                        try:
+                            report(engine)
+                        except Exception:
+                            pass
+                _, stats = measure('report', students, 'students', render)
+                results.append(dict(stats, engine=name, students=students))
+
+        # Divergences are kept for the last (largest) gradebook, which contains the smaller ones
+        divergences = {}
+        for name, output in outputs.items():
+            if name == REFERENCE:
+                continue
+            counts, samples = {}, []
+            for student, (expected, actual) in enumerate(zip(outputs[REFERENCE], output)):
+                fields = compare(expected, actual, tolerance)
+                for field in fields:
+                    counts[field] = counts.get(field, 0) + 1
+                if fields and len(samples) < examples:
+                    samples.append({'student': student, 'fields': fields, REFERENCE: expected, name: actual})
+            divergences[name] = {'students': students, 'fields': counts, 'examples': samples}
+
+    return {
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'parameters': {
+            'sizes': list(sizes), 'assignments': assignments, 'missing_rate': missing_rate,
+            'seed': seed, 'tolerance': tolerance,
+        },
+        'results': results,
+        'divergences': divergences,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark and cross-check the four grade calculators.")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 10000], help="students per gradebook")
+    parser.add_argument('--assignments', type=int, default=8, help="assignments per student")
+    parser.add_argument('--missing-rate', type=float, default=0.05, help="share of students with one category only")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--tolerance', type=float, default=1e-9, help="relative tolerance for grade comparisons")
+    parser.add_argument('--output', help="write the results as JSON to this file")
+    args = parser.parse_args()
+
+    report = run_benchmark(sorted(args.sizes), args.assignments, args.missing_rate, args.seed, args.tolerance)
+
+    print("\n--- Grade Calculator Benchmark ---")
+    print(f"{'Engine':<16}{'Stage':<10}{'Students':>10}{'Seconds':>10}{'Per second':>14}{'Peak MB':>10}")
+    for stats in report['results']:
+        throughput = f"{stats['throughput']:.0f}" if stats['throughput'] else "-"
+        print(f"{stats['engine']:<16}{stats['stage']:<10}{stats['students']:>10}{stats['seconds']:>10.3f}"
+              f"{throughput:>14}{stats['peak_bytes'] / 1e6:>10.2f}")
+
+    print(f"\n--- Divergences from {REFERENCE} ---")
+    for name, divergence in report['divergences'].items():
+        if not divergence['fields']:
+            print(f"{name:<16}matches on all {divergence['students']} students")
+            continue
+        counts = ', '.join(f"{field}: {count}" for field, count in sorted(divergence['fields'].items()))
+        print(f"{name:<16}{counts} (of {divergence['students']} students)")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=2, default=str)
+        print(f"Results written to {args.output}")
+
+if __name__ == "__main__":
+    main()
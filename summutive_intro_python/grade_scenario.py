@@ -0,0 +1,195 @@
+import math
+from array import array
+from collections import namedtuple
+
+from gpa_scale import FOUR_POINT_SCALE
+from grade_batch import round_exact_sum
+
+try:
+    import numpy as np  # Optional: vectorized fast path
+except ImportError:
+    np = None
+
+PASS_THRESHOLD = 50  # Both categories need at least this (determine_pass_fail / deter_fail_pass)
+INFEASIBLE = math.inf  # Required grade when no grade on the remaining work is enough
+
+# Current totals per student, one column each
+# The *_low columns are optional: the part of each exact total its rounded column leaves out, so the
+# solver rounds sums the way the calculator's running totals do (None is read as all zeros)
+Aggregates = namedtuple("Aggregates", ["fa_score", "fa_weight", "sa_score", "sa_weight",
+                                       "fa_score_low", "fa_weight_low", "sa_score_low", "sa_weight_low"],
+                        defaults=(None, None, None, None))
+# Average grade needed on the remaining work, one column each
+# fa_required / sa_required: to reach the pass threshold in that category (0 = already secured)
+# target_required: on all remaining work, to reach the target GPA (NaN when no target was given)
+# can_pass: 1 when both categories can still be passed, weight_ok: 0 when the 100% cap is exceeded
+ScenarioResult = namedtuple("ScenarioResult", ["fa_required", "sa_required", "target_required", "can_pass", "weight_ok"])
+
+
+# Read the running totals of StudentCalculatorGrade objects into columns
+def aggregates_from_calculators(calculators):
+    columns = Aggregates(*(array("d") for _ in Aggregates._fields))
+    for calculator in calculators:
+        for total, (column, low_column) in (
+            (calculator.ass_cat_scores["FA"], (columns.fa_score, columns.fa_score_low)),
+            (calculator.ass_weights["FA"], (columns.fa_weight, columns.fa_weight_low)),
+            (calculator.ass_cat_scores["SA"], (columns.sa_score, columns.sa_score_low)),
+            (calculator.ass_weights["SA"], (columns.sa_weight, columns.sa_weight_low)),
+        ):
+            value, remainder = total.value_and_remainder()
+            column.append(value)
+            low_column.append(remainder)
+    return columns
+
+
+# Columns that add up to each total: (fa_score, fa_weight, sa_score, sa_weight), each a list of columns
+def total_parts(aggregates):
+    return tuple(
+        [column] if low_column is None else [column, low_column]
+        for column, low_column in zip(aggregates[:4], aggregates[4:])
+    )
+
+
+# Grade the calculator reports once each remaining weight is added as one assignment graded `grade`:
+# the category (or overall) totals are math.fsum sums, like StudentCalculatorGrade's running totals
+def grade_reached(scores, weights, remaining, grade):
+    total_weight = math.fsum([*weights, *remaining])
+    total_score = math.fsum([*scores, *[(weight * grade) / 100 for weight in remaining]])
+    return (total_score / total_weight) * 100 if total_weight > 0 else 0
+
+
+# Grade on the remaining weights that the calculator rounds to at least threshold (INFEASIBLE above 100):
+# the closed form, raised to the next passing grade when rounding leaves it a few ulps short
+def solve_required(scores, weights, remaining, threshold):
+    left = math.fsum(remaining)
+    if left <= 0:
+        return 0.0 if grade_reached(scores, weights, remaining, 0) >= threshold else INFEASIBLE
+    # (score + remaining * g / 100) / (weight + remaining) * 100 >= threshold, solved for g
+    needed = min(max(0.0, (threshold * (math.fsum(weights) + left) - 100 * math.fsum(scores)) / left), 100.0)
+    if grade_reached(scores, weights, remaining, needed) >= threshold:
+        return needed
+    if grade_reached(scores, weights, remaining, 100.0) < threshold:
+        return INFEASIBLE
+    # The closed form came out a few ulps short after rounding: bisect up to the next grade that passes
+    low, high = needed, 100.0
+    while True:
+        middle = low + (high - low) / 2
+        if not low < middle < high:
+            return high
+        if grade_reached(scores, weights, remaining, middle) >= threshold:
+            high = middle
+        else:
+            low = middle
+
+
+# Average grade needed on `remaining` weight to bring a category (score, weight) up to threshold
+def required_grade(score, weight, remaining, threshold):
+    return solve_required((score,), (weight,), (remaining,), threshold)
+
+
+# Solve every student's scenario in one pass over the columns
+# fa_remaining / sa_remaining are the weights still to be graded in each category
+def solve_scenarios(aggregates, fa_remaining, sa_remaining, target_gpa=None, scale=FOUR_POINT_SCALE, threshold=PASS_THRESHOLD):
+    target = scale.min_percentage(target_gpa) if target_gpa is not None else None
+    if np is not None:
+        return solve_scenarios_numpy(aggregates, fa_remaining, sa_remaining, target_gpa, target, threshold)
+    nan = float("nan")
+    result = ScenarioResult(array("d"), array("d"), array("d"), bytearray(), bytearray())
+    fa_scores, fa_weights, sa_scores, sa_weights = total_parts(aggregates)
+
+    for student, (fa_left, sa_left) in enumerate(zip(fa_remaining, sa_remaining)):
+        fa_score = tuple(column[student] for column in fa_scores)
+        fa_weight = tuple(column[student] for column in fa_weights)
+        sa_score = tuple(column[student] for column in sa_scores)
+        sa_weight = tuple(column[student] for column in sa_weights)
+        # add_assignment never lets the total weight go over 100%
+        weight_ok = math.fsum(fa_weight + sa_weight) + fa_left + sa_left <= 100
+        result.weight_ok.append(weight_ok)
+        if not weight_ok:
+            result.fa_required.append(nan)
+            result.sa_required.append(nan)
+            result.target_required.append(nan)
+            result.can_pass.append(0)
+            continue
+
+        fa_needed = solve_required(fa_score, fa_weight, (fa_left,), threshold)
+        sa_needed = solve_required(sa_score, sa_weight, (sa_left,), threshold)
+        result.fa_required.append(fa_needed)
+        result.sa_required.append(sa_needed)
+        result.can_pass.append(fa_needed <= 100 and sa_needed <= 100)
+
+        if target is None:
+            result.target_required.append(nan if target_gpa is None else INFEASIBLE)
+        else:
+            result.target_required.append(
+                solve_required(fa_score + sa_score, fa_weight + sa_weight, (fa_left, sa_left), target)
+            )
+
+    return result
+
+
+# Correctly rounded sum of a few columns, element by element (math.fsum per student)
+def fsum_columns(columns):
+    if len(columns) == 1:
+        return columns[0]
+    if len(columns) == 2:
+        return columns[0] + columns[1]  # A sum of two floats is already correctly rounded
+    totals, unsure = round_exact_sum(columns)
+    for student in np.flatnonzero(unsure):
+        totals[student] = math.fsum(column[student] for column in columns)
+    return totals
+
+
+# NumPy path of grade_reached: scores, weights and remaining are lists of columns
+def grade_reached_numpy(scores, weights, remaining, grade):
+    total_weight = fsum_columns([*weights, *remaining])
+    total_score = fsum_columns([*scores, *[(weight * grade) / 100 for weight in remaining]])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(total_weight > 0, (total_score / total_weight) * 100, 0)
+
+
+# NumPy path of solve_required, one student per element
+def solve_required_numpy(scores, weights, remaining, threshold):
+    left, weight, score = fsum_columns(remaining), fsum_columns(weights), fsum_columns(scores)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        needed = np.clip((threshold * (weight + left) - 100 * score) / left, 0.0, 100.0)
+    needed[left <= 0] = 0.0
+    passes = grade_reached_numpy(scores, weights, remaining, needed) >= threshold
+    feasible = grade_reached_numpy(scores, weights, remaining, np.full_like(needed, 100.0)) >= threshold
+
+    # Bisect the students whose closed form came out a few ulps short, all at once
+    short = np.flatnonzero(~passes & feasible & (left > 0))
+    low, high = needed[short], np.full(len(short), 100.0)
+    parts = [[column[short] for column in columns] for columns in (scores, weights, remaining)]
+    while len(short):
+        middle = low + (high - low) / 2
+        done = (middle <= low) | (middle >= high)
+        needed[short[done]] = high[done]
+        keep = ~done
+        short, low, high, middle = short[keep], low[keep], high[keep], middle[keep]
+        parts = [[column[keep] for column in columns] for columns in parts]
+        reached = grade_reached_numpy(*parts, middle) >= threshold
+        high = np.where(reached, middle, high)
+        low = np.where(reached, low, middle)
+    return np.where(passes | feasible, needed, INFEASIBLE)
+
+
+def solve_scenarios_numpy(aggregates, fa_remaining, sa_remaining, target_gpa, target, threshold):
+    fa_scores, fa_weights, sa_scores, sa_weights = (
+        [np.asarray(column, dtype=np.float64) for column in columns] for columns in total_parts(aggregates)
+    )
+    fa_left = np.asarray(fa_remaining, dtype=np.float64)
+    sa_left = np.asarray(sa_remaining, dtype=np.float64)
+    weight_ok = fsum_columns(fa_weights + sa_weights) + fa_left + sa_left <= 100
+
+    fa_needed = solve_required_numpy(fa_scores, fa_weights, [fa_left], threshold)
+    sa_needed = solve_required_numpy(sa_scores, sa_weights, [sa_left], threshold)
+    if target is None:
+        target_needed = np.full(len(fa_left), np.nan if target_gpa is None else INFEASIBLE)
+    else:
+        target_needed = solve_required_numpy(fa_scores + sa_scores, fa_weights + sa_weights, [fa_left, sa_left], target)
+
+    can_pass = weight_ok & (fa_needed <= 100) & (sa_needed <= 100)
+    columns = [np.where(weight_ok, needed, np.nan) for needed in (fa_needed, sa_needed, target_needed)]
+    return ScenarioResult(*(array("d", column.tobytes()) for column in columns),
+                          bytearray(can_pass.astype(np.uint8).tobytes()), bytearray(weight_ok.astype(np.uint8).tobytes()))
@@ -0,0 +1,192 @@
+import asyncio
+import json
+import math
+import sys
+from array import array
+
+from gpa_scale import FOUR_POINT_SCALE
+from grade_batch import CATEGORY_CODES, calculate_cohort_grades
+from gradebook_import import parse_records, validate_rows
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+BATCH_SIZE = 1024  # Most requests graded in one calculate_cohort_grades call
+BATCH_WINDOW = 0.0  # Extra seconds to wait for a batch to fill (0 = take whatever is already queued)
+MAX_QUEUED = 8192  # Requests waiting for the batcher before readers stop reading
+MAX_IN_FLIGHT = 256  # Unanswered requests per connection before that connection stops being read
+LINE_LIMIT = 1 << 20  # Longest request line in bytes
+
+
+# Check one request and turn its assignments into validated gradebook rows
+# Request: {"id": ..., "student_name": ..., "class_name": ..., "assignments": [{"ass_name", "ass_cat", "weight", "grade"}]}
+# Returns (rows, rejected), where rejected lists {"index", "reason"} for the assignments add_assignment would skip
+def parse_request(request):
+    if not isinstance(request, dict) or not isinstance(request.get("assignments"), list):
+        raise ValueError("Request must be a JSON object with an 'assignments' list.")
+    if request.get("student_name") in (None, ""):
+        raise ValueError("Missing field(s): student_name.")
+
+    rejected = []
+    student = {"student_name": request["student_name"], "class_name": request.get("class_name")}
+    records = ((index, dict(assignment, **student) if isinstance(assignment, dict) else None)
+               for index, assignment in enumerate(request["assignments"]))
+
+    def on_reject(index, reason):
+        rejected.append({"index": index, "reason": reason})
+
+    return list(validate_rows(parse_records(records, on_reject), on_reject)), rejected
+
+
+# Grade a batch of parsed requests with one vectorized grade_batch call
+def grade_batch_requests(batch, scale=FOUR_POINT_SCALE):
+    student_ids, categories, weights, grades = array("I"), array("B"), array("d"), array("d")
+    for student_id, (rows, _) in enumerate(batch):
+        for row in rows:
+            student_ids.append(student_id)
+            categories.append(CATEGORY_CODES[row.ass_cat])
+            weights.append(row.weight)
+            grades.append(row.grade)
+    results = calculate_cohort_grades(student_ids, categories, weights, grades, len(batch), scale)
+
+    responses = []
+    for (_, rejected), overall, formative, summative, gpa in zip(
+        batch, results.overall, results.formative, results.summative, results.gpa
+    ):
+        if math.isnan(overall):
+            response = {"error": "Cannot calculate GPA. Missing FA or SA category."}
+        else:
+            response = {
+                "overall": overall,
+                "formative": formative,
+                "summative": summative,
+                "gpa": gpa,
+                "status": "Pass" if formative >= 50 and summative >= 50 else "Fail and Retake",
+            }
+        if rejected:
+            response["rejected"] = rejected
+        responses.append(response)
+    return responses
+
+
+# Line-delimited JSON grading server; concurrent requests are coalesced into micro-batches
+class GradeService:
+    def __init__(self, scale=FOUR_POINT_SCALE, batch_size=BATCH_SIZE, batch_window=BATCH_WINDOW,
+                 max_queued=MAX_QUEUED, max_in_flight=MAX_IN_FLIGHT):
+        self.scale = scale
+        self.batch_size = batch_size
+        self.batch_window = batch_window
+        self.max_in_flight = max_in_flight
+        self.queue = asyncio.Queue(max_queued)  # (parsed request, future); a full queue pauses the readers
+        self.batches = 0
+        self.requests = 0
+
+    # Take everything already queued, up to batch_size
+    def drain(self, batch):
+        while len(batch) < self.batch_size and not self.queue.empty():
+            batch.append(self.queue.get_nowait())
+
+    async def run_batcher(self):
+        while True:
+            batch = [await self.queue.get()]
+            self.drain(batch)
+            if self.batch_window and len(batch) < self.batch_size:
+                await asyncio.sleep(self.batch_window)
+                self.drain(batch)
+
+            live = [(parsed, future) for parsed, future in batch if not future.cancelled()]
+            try:
+                responses = grade_batch_requests([parsed for parsed, _ in live], self.scale)
+            except Exception as error:  # Answer every request of the batch rather than leave them hanging
+                responses = [{"error": f"Grading failed: {error}"}] * len(live)
+            for (_, future), response in zip(live, responses):
+                future.set_result(response)
+            self.batches += 1
+            self.requests += len(live)
+
+    # Parse a request and queue it for the batcher; returns a future with the response
+    async def submit(self, request):
+        future = asyncio.get_running_loop().create_future()
+        try:
+            parsed = parse_request(request)
+        except ValueError as error:
+            future.set_result({"error": str(error)})
+            return future
+        except Exception as error:  # Answer a request that breaks the parser instead of dropping the connection
+            future.set_result({"error": f"Invalid request: {error}"})
+            return future
+        await self.queue.put((parsed, future))
+        return future
+
+    # Read requests from one client and answer them in order
+    async def handle_client(self, reader, writer):
+        in_flight = asyncio.Queue(self.max_in_flight)
+        responder = asyncio.create_task(self.respond(in_flight, writer))
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (ValueError, asyncio.LimitOverrunError):
+                    break  # Line longer than LINE_LIMIT
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                try:
+                    request = json.loads(line)
+                except ValueError:
+                    request = None
+                request_id = request.get("id") if isinstance(request, dict) else None
+                if request is None:
+                    future = asyncio.get_running_loop().create_future()
+                    future.set_result({"error": "Request is not valid JSON."})
+                else:
+                    future = await self.submit(request)
+                await in_flight.put((request_id, request, future))
+            await in_flight.put(None)  # Answer what is left, then hang up
+            await responder
+        except ConnectionError:
+            pass
+        finally:
+            responder.cancel()
+            writer.close()
+
+    async def respond(self, in_flight, writer):
+        while True:
+            item = await in_flight.get()
+            if item is None:
+                return
+            request_id, request, future = item
+            response = dict(await future, id=request_id)
+            if isinstance(request, dict) and "error" not in response:
+                response["student_name"] = request.get("student_name")
+                response["class_name"] = request.get("class_name") or ""
+            try:
+                writer.write(json.dumps(response).encode("utf-8") + b"\n")
+                if in_flight.empty():  # Flush once the pipeline is drained
+                    await writer.drain()
+            except ConnectionError:
+                return
+
+    async def serve(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        batcher = asyncio.create_task(self.run_batcher())
+        server = await asyncio.start_server(self.handle_client, host, port, limit=LINE_LIMIT)
+        print(f"Grading service listening on {host}:{port}")
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            batcher.cancel()
+
+
+# Run the grading service
+def main():
+    host = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_HOST
+    port = int(sys.argv[2]) if len(sys.argv) > 2 else DEFAULT_PORT
+    try:
+        asyncio.run(GradeService().serve(host, port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
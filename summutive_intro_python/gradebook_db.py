@@ -0,0 +1,228 @@
+import sqlite3
+import sys
+
+from gpa_scale import FOUR_POINT_SCALE
+from gradebook_import import import_gradebook
+from running_sum import RunningSum
+from test2 import Assignment, StudentCalculatorGrade
+
+DEFAULT_DB_FILE = "gradebook.sqlite3"
+BATCH_SIZE = 10000  # Rows written per transaction during bulk loads
+INSERT_SQL = (
+    "INSERT INTO assignments (class_name, student_name, ass_name, ass_cat, weight, grade) VALUES (?, ?, ?, ?, ?, ?)"
+)
+
+# Category and overall totals per student, aggregated inside SQLite
+# FSUM rounds each total once, like StudentCalculatorGrade's running totals (SQL SUM adds in row order)
+STUDENT_TOTALS_SQL = (
+    "SELECT class_name, student_name, "
+    "FSUM(CASE WHEN ass_cat = 'FA' THEN weight * grade / 100 END), FSUM(CASE WHEN ass_cat = 'FA' THEN weight END), "
+    "FSUM(CASE WHEN ass_cat = 'SA' THEN weight * grade / 100 END), FSUM(CASE WHEN ass_cat = 'SA' THEN weight END), "
+    "FSUM(weight * grade / 100), FSUM(weight) "
+    "FROM assignments"
+)
+
+
+# SQLite aggregate FSUM(x): the correctly rounded sum of the non-NULL values (math.fsum), NULL when there are none
+class FSum:
+    def __init__(self):
+        self.total = None
+
+    def step(self, value):
+        if value is not None:
+            if self.total is None:
+                self.total = RunningSum()
+            self.total.add(value)
+
+    def finalize(self):
+        return None if self.total is None else self.total.value()
+
+
+# Persistent gradebook stored in a local SQLite database (WAL mode)
+class GradebookDB:
+    def __init__(self, path=DEFAULT_DB_FILE):
+        self.connection = sqlite3.connect(path)
+        self.connection.create_aggregate("fsum", 1, FSum)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS assignments ("
+            "id INTEGER PRIMARY KEY, class_name TEXT NOT NULL, student_name TEXT NOT NULL, "
+            "ass_name TEXT NOT NULL, ass_cat TEXT NOT NULL CHECK (ass_cat IN ('FA', 'SA')), "
+            "weight REAL NOT NULL, grade REAL NOT NULL)"
+        )
+        # Student lookups (and whole cohorts) are a range scan of this index
+        self.connection.execute(
+            "CREATE INDEX IF NOT EXISTS assignments_student ON assignments (class_name, student_name, ass_cat)"
+        )
+        # A student across all of their classes (student_results with no class_name)
+        self.connection.execute(
+            "CREATE INDEX IF NOT EXISTS assignments_student_name ON assignments (student_name, class_name)"
+        )
+        self.connection.execute("CREATE INDEX IF NOT EXISTS assignments_category ON assignments (ass_cat, grade)")
+        self.pending = []  # Rows waiting for the next batched insert
+        self.pending_weights = {}  # (class_name, student_name) -> weight of their pending rows
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.flush()
+        self.connection.close()
+
+    # Total weight already stored for a student (including rows not yet flushed)
+    def total_weight(self, class_name, student_name):
+        row = self.connection.execute(
+            "SELECT COALESCE(FSUM(weight), 0) FROM assignments WHERE class_name = ? AND student_name = ?",
+            (class_name, student_name),
+        ).fetchone()
+        return row[0] + self.pending_weights.get((class_name, student_name), 0)
+
+    # Report a row that add_assignment or load_rows skipped; instrumentation counts the calls by reason
+    def reject(self, reason, row=None):
+        print("⚠️", reason if row is None else f"Skipping '{row.ass_name}' of {row.student_name}: {reason}")
+
+    # Same checks as StudentCalculatorGrade.add_assignment, then queue the row for a batched insert
+    def add_assignment(self, class_name, student_name, ass_name, ass_cat, weight, grade):
+        category = Assignment.normalize_category(ass_cat)
+        if category is None:
+            self.reject("Invalid category. Use 'FA' (Formative) or 'SA' (Summative).")
+            return
+        if not (0 <= grade <= 100):
+            self.reject("Grade must be between 0 and 100.")
+            return
+        if not (0 <= weight <= 100):
+            self.reject("Weight must be between 0 and 100.")
+            return
+        if self.total_weight(class_name, student_name) + weight > 100:
+            self.reject("Total weight cannot exceed 100%.")
+            return
+        self.pending.append((class_name, student_name, ass_name, category, weight, grade))
+        key = (class_name, student_name)
+        self.pending_weights[key] = self.pending_weights.get(key, 0) + weight
+        if len(self.pending) >= BATCH_SIZE:
+            self.flush()
+
+    # Write queued rows in one transaction
+    def flush(self):
+        if not self.pending:
+            return
+        with self.connection:
+            self.connection.executemany(INSERT_SQL, self.pending)
+        self.pending.clear()
+        self.pending_weights.clear()
+
+    # Bulk load rows already validated by gradebook_import, BATCH_SIZE per transaction
+    # Rows that would take a student past 100% together with the rows already stored are skipped
+    def load_rows(self, rows):
+        self.flush()
+        total_weights = {}  # (class_name, student_name) -> stored weight, read once per student
+        count, batch = 0, []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= BATCH_SIZE:
+                count += self.insert_batch(batch, total_weights)
+                batch = []
+        return count + self.insert_batch(batch, total_weights)
+
+    # Insert one batch of rows in a transaction; returns how many were inserted
+    def insert_batch(self, batch, total_weights):
+        if not batch:
+            return 0
+        accepted = []
+        with self.connection:
+            new_keys = {(row.class_name, row.student_name) for row in batch}.difference(total_weights)
+            if new_keys:
+                total_weights.update(dict.fromkeys(new_keys, 0))
+                total_weights.update(self.stored_weights(new_keys))
+            for row in batch:
+                key = (row.class_name, row.student_name)
+                if total_weights[key] + row.weight > 100:
+                    self.reject("Total weight cannot exceed 100%.", row)
+                    continue
+                total_weights[key] += row.weight
+                accepted.append((row.class_name, row.student_name, row.ass_name, row.ass_cat, row.weight, row.grade))
+            self.connection.executemany(INSERT_SQL, accepted)
+        return len(accepted)
+
+    # Stored weight of each (class_name, student_name) key, from one GROUP BY over a temp table of the keys
+    def stored_weights(self, keys):
+        self.connection.execute(
+            "CREATE TEMP TABLE IF NOT EXISTS batch_students ("
+            "class_name TEXT, student_name TEXT, PRIMARY KEY (class_name, student_name)) WITHOUT ROWID"
+        )
+        self.connection.execute("DELETE FROM batch_students")
+        self.connection.executemany("INSERT INTO batch_students VALUES (?, ?)", keys)
+        # CROSS JOIN keeps batch_students as the outer loop, so only the batch's students are read from the index
+        return {
+            (class_name, student_name): weight
+            for class_name, student_name, weight in self.connection.execute(
+                "SELECT b.class_name, b.student_name, FSUM(a.weight) FROM batch_students b "
+                "CROSS JOIN assignments a ON a.class_name = b.class_name AND a.student_name = b.student_name "
+                "GROUP BY b.class_name, b.student_name"
+            )
+        }
+
+    # Rebuild one student's StudentCalculatorGrade, reading only that student's rows
+    def load_calculator(self, class_name, student_name):
+        self.flush()
+        calculator = StudentCalculatorGrade(student_name, class_name)
+        for ass_name, ass_cat, weight, grade in self.connection.execute(
+            "SELECT ass_name, ass_cat, weight, grade FROM assignments "
+            "WHERE class_name = ? AND student_name = ? ORDER BY id",
+            (class_name, student_name),
+        ):
+            calculator.add_assignment(ass_name, ass_cat, weight, grade)
+        return calculator
+
+    # Final grades computed from SQL aggregates: (class, student, overall, formative, summative, GPA)
+    def student_results(self, class_name=None, student_name=None, scale=FOUR_POINT_SCALE):
+        self.flush()
+        sql, params = STUDENT_TOTALS_SQL, ()
+        if class_name is not None and student_name is not None:
+            sql, params = sql + " WHERE class_name = ? AND student_name = ?", (class_name, student_name)
+        elif class_name is not None:
+            sql, params = sql + " WHERE class_name = ?", (class_name,)
+        elif student_name is not None:  # The student in every class they are enrolled in
+            sql, params = sql + " WHERE student_name = ?", (student_name,)
+        sql += " GROUP BY class_name, student_name ORDER BY class_name, student_name"
+
+        results = []
+        for cohort, student, fa_score, fa_weight, sa_score, sa_weight, total_score, total_weight in self.connection.execute(
+            sql, params
+        ):
+            if fa_weight is None or sa_weight is None:  # Missing FA or SA category
+                results.append((cohort, student, None, None, None, None))
+                continue
+            overall = (total_score / total_weight) * 100 if total_weight > 0 else 0
+            formative = (fa_score / fa_weight) * 100 if fa_weight > 0 else 0
+            summative = (sa_score / sa_weight) * 100 if sa_weight > 0 else 0
+            results.append((cohort, student, overall, formative, summative, scale.convert(overall)))
+        return results
+
+
+# Load a gradebook file into the database and print the cohort results
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: gradebook_db.py DATABASE [GRADEBOOK.csv|GRADEBOOK.jsonl] [COHORT]")
+        return
+
+    with GradebookDB(sys.argv[1]) as db:
+        if len(sys.argv) > 2 and sys.argv[2]:
+            print(f"Loaded {db.load_rows(import_gradebook(sys.argv[2]))} rows.")
+        cohort = sys.argv[3] if len(sys.argv) > 3 else None
+
+        print(f"\n{'Cohort':<15}{'Student':<20}{'Overall (%)':<14}{'GPA'}")
+        print("-" * 55)
+        for class_name, student_name, overall, _, _, gpa in db.student_results(cohort):
+            if overall is None:
+                print(f"{class_name:<15}{student_name:<20}{'Missing FA or SA category.'}")
+            else:
+                print(f"{class_name:<15}{student_name:<20}{overall:<14.2f}{gpa:.2f}")
+
+
+if __name__ == "__main__":
+    main()
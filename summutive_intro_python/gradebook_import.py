@@ -0,0 +1,139 @@
+import csv
+import json
+import math
+import sys
+from array import array
+from collections import namedtuple
+
+from grade_batch import CATEGORY_CODES, calculate_cohort_grades
+from test2 import Assignment, StudentCalculatorGrade
+
+# One validated gradebook row
+GradeRow = namedtuple("GradeRow", ["student_name", "class_name", "ass_name", "ass_cat", "weight", "grade"])
+
+REQUIRED_FIELDS = ("student_name", "ass_name", "ass_cat", "weight", "grade")
+
+
+# Print a rejected row the same way add_assignment reports errors
+def print_rejection(line_no, reason):
+    print("⚠️", f"Line {line_no}: {reason}")
+
+
+# Yield (line number, record dict) from a .csv or .jsonl gradebook, one row at a time
+def read_records(path):
+    with open(path, "r", encoding="utf-8", newline="") as file:
+        if path.endswith(".csv"):
+            reader = csv.DictReader(file)
+            for record in reader:
+                yield reader.line_num, record
+        else:
+            for line_no, line in enumerate(file, 1):
+                if line.strip():
+                    try:
+                        yield line_no, json.loads(line)
+                    except ValueError:
+                        yield line_no, None
+
+
+# Turn raw records into typed rows, rejecting anything that cannot be parsed
+def parse_records(records, on_reject):
+    for line_no, record in records:
+        if not isinstance(record, dict):
+            on_reject(line_no, "Row is not valid JSON.")
+            continue
+        missing = [field for field in REQUIRED_FIELDS if record.get(field) in (None, "")]
+        if missing:
+            on_reject(line_no, f"Missing field(s): {', '.join(missing)}.")
+            continue
+        try:
+            weight = float(record["weight"])
+            grade = float(record["grade"])
+        except (TypeError, ValueError, OverflowError):  # OverflowError: JSON integers too big for a float
+            on_reject(line_no, "Weight and grade must be numbers.")
+            continue
+        if math.isnan(weight) or math.isnan(grade):
+            on_reject(line_no, "Weight and grade must be numbers.")
+            continue
+        yield line_no, GradeRow(
+            str(record["student_name"]), str(record.get("class_name") or ""),
+            str(record["ass_name"]), str(record["ass_cat"]), weight, grade,
+        )
+
+
+# Apply the same checks as add_assignment, keeping only one running weight per student
+def validate_rows(rows, on_reject):
+    total_weights = {}
+    for line_no, row in rows:
+        category = Assignment.normalize_category(row.ass_cat)
+        if category is None:
+            on_reject(line_no, "Invalid category. Use 'FA' (Formative) or 'SA' (Summative).")
+            continue
+        if not (0 <= row.grade <= 100):
+            on_reject(line_no, "Grade must be between 0 and 100.")
+            continue
+        if not (0 <= row.weight <= 100):
+            on_reject(line_no, "Weight must be between 0 and 100.")
+            continue
+        key = (row.class_name, row.student_name)
+        total_weight = total_weights.get(key, 0)
+        if total_weight + row.weight > 100:
+            on_reject(line_no, "Total weight cannot exceed 100%.")
+            continue
+        total_weights[key] = total_weight + row.weight
+        yield row._replace(ass_cat=category)
+
+
+# Stream the valid rows of a gradebook file
+def import_gradebook(path, on_reject=print_rejection):
+    return validate_rows(parse_records(read_records(path), on_reject), on_reject)
+
+
+# Build one StudentCalculatorGrade per (class, student) from a gradebook file
+def load_calculators(path, on_reject=print_rejection):
+    calculators = {}
+    for row in import_gradebook(path, on_reject):
+        key = (row.class_name, row.student_name)
+        calculator = calculators.get(key)
+        if calculator is None:
+            calculator = calculators[key] = StudentCalculatorGrade(row.student_name, row.class_name)
+        calculator.add_assignment(row.ass_name, row.ass_cat, row.weight, row.grade)
+    return calculators
+
+
+# Build the grade_batch input columns from a gradebook file, plus the (class, student) of each id
+def load_columns(path, on_reject=print_rejection):
+    students, student_index = [], {}
+    student_ids, categories, weights, grades = array("I"), array("B"), array("d"), array("d")
+    for row in import_gradebook(path, on_reject):
+        key = (row.class_name, row.student_name)
+        student_id = student_index.get(key)
+        if student_id is None:
+            student_id = student_index[key] = len(students)
+            students.append(key)
+        student_ids.append(student_id)
+        categories.append(CATEGORY_CODES[row.ass_cat])
+        weights.append(row.weight)
+        grades.append(row.grade)
+    return students, (student_ids, categories, weights, grades)
+
+
+# Grade a whole gradebook file without any interactive input
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: gradebook_import.py GRADEBOOK.csv|GRADEBOOK.jsonl")
+        return
+
+    students, columns = load_columns(sys.argv[1])
+    results = calculate_cohort_grades(*columns, num_students=len(students))
+
+    print(f"\n{'Cohort':<15}{'Student':<20}{'Overall (%)':<14}{'GPA'}")
+    print("-" * 55)
+    for (class_name, student_name), overall, gpa in zip(students, results.overall, results.gpa):
+        if math.isnan(overall):
+            print(f"{class_name:<15}{student_name:<20}{'Missing FA or SA category.'}")
+        else:
+            print(f"{class_name:<15}{student_name:<20}{overall:<14.2f}{gpa:.2f}")
+
+
+if __name__ == "__main__":
+    main()
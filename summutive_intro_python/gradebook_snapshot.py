@@ -0,0 +1,144 @@
+import math
+import mmap
+import struct
+import sys
+from array import array
+
+from gpa_scale import FOUR_POINT_SCALE
+from grade_batch import CATEGORY_CODES, segment_grades
+
+MAGIC = b"GRDSNAP\0"
+VERSION = 1
+CATEGORIES = ("FA", "SA")  # Category column codes, as in grade_batch
+# magic, version, byte order (1 = little), student count, row count, string count, then 9 section offsets
+HEADER = struct.Struct("<8sII3Q9Q")
+SECTIONS = ("weights", "grades", "categories", "name_ids", "student_rows", "student_names", "class_names",
+            "string_offsets", "strings")
+SECTION_TYPES = {"weights": "d", "grades": "d", "categories": "B", "name_ids": "I", "student_rows": "Q",
+                 "student_names": "I", "class_names": "I", "string_offsets": "Q", "strings": "B"}
+
+
+# Write StudentCalculatorGrade objects to a snapshot file
+# Layout: header, then one 8-byte aligned column per section; rows are grouped by student and
+# student_rows[i]:student_rows[i + 1] is the row range of student i
+def write_snapshot(path, calculators):
+    strings, string_ids = [], {}
+
+    def intern(text):
+        string_id = string_ids.get(text)
+        if string_id is None:
+            string_id = string_ids[text] = len(strings)
+            strings.append(text)
+        return string_id
+
+    columns = {name: array(SECTION_TYPES[name]) for name in SECTIONS}
+    columns["student_rows"].append(0)
+    for calculator in calculators:
+        for assignment in calculator.assignments:
+            columns["weights"].append(assignment.weight)
+            columns["grades"].append(assignment.grade)
+            columns["categories"].append(CATEGORY_CODES[assignment.ass_cat])
+            columns["name_ids"].append(intern(assignment.name))
+        columns["student_rows"].append(len(columns["weights"]))
+        columns["student_names"].append(intern(calculator.student_name))
+        columns["class_names"].append(intern(calculator.class_name))
+
+    columns["string_offsets"].append(0)
+    for text in strings:
+        columns["strings"].frombytes(text.encode("utf-8"))
+        columns["string_offsets"].append(len(columns["strings"]))
+
+    if sys.byteorder != "little":
+        for column in columns.values():
+            column.byteswap()
+
+    offsets, position = [], HEADER.size
+    for name in SECTIONS:
+        position = (position + 7) & ~7  # Keep every column aligned for zero-copy casts
+        offsets.append(position)
+        position += len(columns[name]) * columns[name].itemsize
+
+    with open(path, "wb") as file:
+        file.write(HEADER.pack(MAGIC, VERSION, 1, len(columns["student_names"]), len(columns["weights"]),
+                               len(strings), *offsets))
+        for name, offset in zip(SECTIONS, offsets):
+            file.write(b"\0" * (offset - file.tell()))
+            file.write(columns[name].tobytes())
+
+
+# Read-only view of a snapshot file; the columns are memoryviews over the mapped file (no copies)
+class GradebookSnapshot:
+    def __init__(self, path):
+        self.file = open(path, "rb")
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, little_endian, students, rows, strings, *offsets = HEADER.unpack_from(self.map)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{path} is not a version {VERSION} gradebook snapshot.")
+        if little_endian != (sys.byteorder == "little"):
+            raise ValueError("Snapshot byte order does not match this machine.")
+        self.num_students, self.num_rows, self.num_strings = students, rows, strings
+
+        lengths = {"weights": rows, "grades": rows, "categories": rows, "name_ids": rows,
+                   "student_rows": students + 1, "student_names": students, "class_names": students,
+                   "string_offsets": strings + 1, "strings": None}
+        view = memoryview(self.map)
+        for name, offset in zip(SECTIONS, offsets):
+            item = SECTION_TYPES[name]
+            length = lengths[name]
+            end = len(self.map) if length is None else offset + length * struct.calcsize(item)
+            setattr(self, name, view[offset:end].cast(item))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        # Views must be released before the map can be closed
+        for name in SECTIONS:
+            getattr(self, name).release()
+        self.map.close()
+        self.file.close()
+
+    def string(self, string_id):
+        return bytes(self.strings[self.string_offsets[string_id]:self.string_offsets[string_id + 1]]).decode("utf-8")
+
+    def student(self, student_id):
+        return self.string(self.student_names[student_id]), self.string(self.class_names[student_id])
+
+    # Assignments of one student as (name, category, weight, grade)
+    def assignments(self, student_id):
+        start, end = self.student_rows[student_id], self.student_rows[student_id + 1]
+        return [(self.string(self.name_ids[row]), CATEGORIES[self.categories[row]], self.weights[row], self.grades[row])
+                for row in range(start, end)]
+
+    # Same result as StudentCalculatorGrade.calculate_fin_grade: segment_grades over this student's offsets only
+    def calculate_fin_grade(self, student_id, scale=FOUR_POINT_SCALE):
+        offsets = self.student_rows[student_id:student_id + 2]
+        grades = segment_grades(offsets, self.categories, self.weights, self.grades, scale)
+        if math.isnan(grades.overall[0]):  # Missing FA or SA category
+            return None, None, None, None
+        return grades.overall[0], grades.formative[0], grades.summative[0], grades.gpa[0]
+
+    # Grade every student at once with grade_batch; student_rows are already the segment offsets,
+    # so the mapped columns are read in place
+    def cohort_grades(self, scale=FOUR_POINT_SCALE):
+        return segment_grades(self.student_rows, self.categories, self.weights, self.grades, scale)
+
+
+# Convert a gradebook file into a snapshot
+def main():
+    if len(sys.argv) < 3:
+        print("Usage: gradebook_snapshot.py GRADEBOOK.csv|GRADEBOOK.jsonl SNAPSHOT")
+        return
+    from gradebook_import import load_calculators
+
+    calculators = load_calculators(sys.argv[1])
+    write_snapshot(sys.argv[2], calculators.values())
+    with GradebookSnapshot(sys.argv[2]) as snapshot:
+        print(f"Snapshot written: {snapshot.num_students} students, {snapshot.num_rows} assignments.")
+
+
+if __name__ == "__main__":
+    main()
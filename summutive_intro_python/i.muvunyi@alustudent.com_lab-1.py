@@ -3,8 +3,14 @@ Innocent Tito Muvunyi: Lab 1: Grade Generator Calculator Project
  
 # Define a class to store assignment details"
 """
+from gpa_scale import FOUR_POINT_SCALE
+from running_sum import RunningSum
+
+
 # Define the Assignment class which represents an individual assignment
 class Assignment:
+    __slots__ = ("name", "ass_cat", "weight", "grade")  # No per-instance __dict__
+
     def __init__(self, ass_name, ass_cat, weight, grade):
         # Initialize the assignment with name, category, weight, and grade
         self.name = ass_name  # Store the assignment name
@@ -37,44 +43,94 @@ class StudentCalculatorGrade:
         self.assignments = []  # List to hold all assignments for the student
         self.total_weight = 0  # Total weight for all assignments
         self.categories_present = {"FA": False, "SA": False}  # Flags for whether categories exist
+        # Running totals kept up to date by add/update/remove, so calculate_fin_grade is O(1)
+        self.category_counts = {"FA": 0, "SA": 0}
+        self.ass_cat_scores = {"FA": RunningSum(), "SA": RunningSum()}
+        self.ass_weights = {"FA": RunningSum(), "SA": RunningSum()}
+        self.total_weighted_score = RunningSum()
+        self.total_weight_sum = RunningSum()
 
     # Method to add an assignment to the grade calculator
     def add_assignment(self, ass_name, ass_cat, weight, grade):
-        if not (0 <= grade <= 100):  # Check if the grade is between 0 and 100
-            print("⚠️", "Grade must be between 0 and 100.")
-            return
-        if not (0 <= weight <= 100):  # Check if the weight is between 0 and 100
-            print("⚠️", "Weight must be between 0 and 100.")
-            return
-        if self.total_weight + weight > 100:  # Check if total weight exceeds 100
-            print("⚠️", "Total weight cannot exceed 100%.")
+        if not self.validate_assignment(ass_cat, weight, grade, self.total_weight):
             return
 
         # Create the assignment object and append to the assignments list
         assignment = Assignment(ass_name, ass_cat, weight, grade)
         self.assignments.append(assignment)
-        self.total_weight += weight  # Update total weight
-        if assignment.ass_cat:  # Check if the category is valid (FA or SA)
-            self.categories_present[assignment.ass_cat] = True
+        self.track(assignment, 1)
 
-    # Method to calculate final grade and GPA
-    def calculate_fin_grade(self):
-        ass_cat_scores = {"FA": 0, "SA": 0}  # Initialize scores for formative and summative categories
-        ass_weights = {"FA": 0, "SA": 0}  # Initialize weights for formative and summative categories
-        total_weighted_score = 0  # Total weighted score across all assignments
+    # Method to change an existing assignment, looked up by name
+    def update_assignment(self, ass_name, ass_cat, weight, grade):
+        assignment = self.find_assignment(ass_name)
+        if assignment is None:
+            return
+        # The assignment being replaced does not count towards the 100% limit
+        if not self.validate_assignment(ass_cat, weight, grade, self.total_weight - assignment.weight):
+            return
+
+        self.track(assignment, -1)
+        assignment.ass_cat = Assignment.normalize_category(ass_cat)
+        assignment.weight = weight
+        assignment.grade = grade
+        self.track(assignment, 1)
+
+    # Method to remove an assignment, looked up by name
+    def remove_assignment(self, ass_name):
+        assignment = self.find_assignment(ass_name)
+        if assignment is None:
+            return
+        self.track(assignment, -1)  # Before removing, a stored record's view does not outlive it
+        self.assignments.remove(assignment)
 
-        # Loop through all assignments and calculate weighted scores
+    # Find an assignment by name
+    def find_assignment(self, ass_name):
         for assignment in self.assignments:
-            weighted_score = assignment.weighted_score()  # Calculate weighted score for each assignment
-            ass_cat_scores[assignment.ass_cat] += weighted_score  # Accumulate scores by category
-            ass_weights[assignment.ass_cat] += assignment.weight  # Accumulate weights by category
-            total_weighted_score += weighted_score  # Add to total weighted score
+            if assignment.name == ass_name:
+                return assignment
+        print("⚠️", f"No assignment named '{ass_name}'.")
+        return None
+
+    # Check an assignment before it is added or updated
+    def validate_assignment(self, ass_cat, weight, grade, other_weight):
+        if Assignment.normalize_category(ass_cat) is None:  # Check if the category is valid (FA or SA)
+            print("⚠️", "Invalid category. Use 'FA' (Formative) or 'SA' (Summative).")
+            return False
+        if not (0 <= grade <= 100):  # Check if the grade is between 0 and 100
+            print("⚠️", "Grade must be between 0 and 100.")
+            return False
+        if not (0 <= weight <= 100):  # Check if the weight is between 0 and 100
+            print("⚠️", "Weight must be between 0 and 100.")
+            return False
+        if other_weight + weight > 100:  # Check if total weight exceeds 100
+            print("⚠️", "Total weight cannot exceed 100%.")
+            return False
+        return True
+
+    # Add (sign=1) or take away (sign=-1) an assignment from the running totals
+    def track(self, assignment, sign):
+        category = assignment.ass_cat
+        weighted_score = assignment.weighted_score()
+        self.ass_cat_scores[category].add(sign * weighted_score)
+        self.ass_weights[category].add(sign * assignment.weight)
+        self.total_weighted_score.add(sign * weighted_score)
+        self.total_weight_sum.add(sign * assignment.weight)
+        self.total_weight = self.total_weight_sum.value()  # Update total weight
+        self.category_counts[category] += sign
+        self.categories_present[category] = self.category_counts[category] > 0
 
+    # Method to calculate final grade and GPA
+    def calculate_fin_grade(self):
         # Check if both formative (FA) and summative (SA) categories are present
         if not self.categories_present["FA"] or not self.categories_present["SA"]:
             print("⚠️", "Cannot calculate GPA. Missing FA or SA category.")
             return None, None, None, None
 
+        # Read the running totals instead of looping through all assignments
+        ass_cat_scores = {category: total.value() for category, total in self.ass_cat_scores.items()}
+        ass_weights = {category: total.value() for category, total in self.ass_weights.items()}
+        total_weighted_score = self.total_weighted_score.value()
+
         # Calculate final grades
         overall_grade = (total_weighted_score / self.total_weight) * 100 if self.total_weight > 0 else 0
         formative_grade = (ass_cat_scores["FA"] / ass_weights["FA"]) * 100 if ass_weights["FA"] > 0 else 0
@@ -84,18 +140,7 @@ class StudentCalculatorGrade:
 
     # Method to convert percentage grade to GPA
     def convert_to_gpa(self, percentage):
-        if percentage >= 85:
-            return 4.0  # Highest GPA
-        elif percentage >= 75:
-            return 3.5  # Second highest GPA
-        elif percentage >= 65:
-            return 3.0  # Middle GPA
-        elif percentage >= 50:
-            return 2.5  # Passing GPA
-        elif percentage >= 40:
-            return 2.0  # Minimum passing GPA
-        else:
-            return 0.0  # Fail GPA
+        return FOUR_POINT_SCALE.convert(percentage)  # 85+ = 4.0, 75+ = 3.5, 65+ = 3.0, 50+ = 2.5, 40+ = 2.0, else 0.0
 
     # Method to determine pass or fail status based on grades
     def determine_pass_fail(self, form_grade, summ_grade):
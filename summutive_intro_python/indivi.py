@@ -1,5 +1,10 @@
+from gpa_scale import LINEAR_FIVE_POINT_SCALE
+
+
 # Class for managing individual assignments
 class Assignment:
+    __slots__ = ("ass_name", "ass_cat", "weight", "grade")  # No per-instance __dict__
+
     def __init__(self, ass_name, ass_cat, weight, grade):
         # Initialize the assignment with name, category, weight, and grade
         self.ass_name = ass_name  
@@ -37,16 +42,16 @@ class StudentCalculateGrade:
         
         # Check for valid category, grade, and weight
         if category is None:
-            print("Error: Invalid category. Use 'FA' (Formative) or 'SA' (Summative).")
+            self.reject("Invalid category. Use 'FA' (Formative) or 'SA' (Summative).")
             return
         if grade < 0 or grade > 100:
-            print("Error: Grade must be between 0 and 100.")
+            self.reject("Grade must be between 0 and 100.")
             return
         if weight < 0 or weight > 100:
-            print("Error: Weight must be between 0 and 100.")
+            self.reject("Weight must be between 0 and 100.")
             return
         if self.total_weight + weight > 100:
-            print("Error: Total weight of assignments must not exceed 100%.")
+            self.reject("Total weight of assignments must not exceed 100%.")
             return
 
         # Add the valid assignment
@@ -54,6 +59,10 @@ class StudentCalculateGrade:
         self.total_weight += weight
         self.categories_present[category] = True  # Mark the category as entered
 
+    # Report an assignment that failed validation; instrumentation counts the calls by reason
+    def reject(self, reason):
+        print(f"Error: {reason}")
+
     # Calculate the final grade (overall, formative, summative)
     def calculate_final_grade(self):
         category_scores = {"FA": 0, "SA": 0}
@@ -75,7 +84,7 @@ class StudentCalculateGrade:
 
     # Calculate GPA based on the final grade
     def calc_gpa(self, final_grade):
-        return round((final_grade / 100) * 5, 2)
+        return LINEAR_FIVE_POINT_SCALE.convert(final_grade)  # Final grade (out of 100) scaled to 5, 2 decimals
 
     # Determine whether the student passes or fails based on the grades
     def deter_fail_pass(self, form_grad, summ_grade):
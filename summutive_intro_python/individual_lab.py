@@ -1,5 +1,10 @@
+from gpa_scale import LINEAR_FIVE_POINT_SCALE
+
+
 # Define a class to store assignment details
 class Assignment:
+    __slots__ = ("name", "ass_cat", "weight", "grade")  # No per-instance __dict__
+
     def __init__(self, ass_name, ass_cat, weight, grade):
         self.name = ass_name  # Store the name of the assignment
         self.ass_cat = self.normalize_category(ass_cat)  # Convert category to uppercase (FA or SA)
@@ -33,17 +38,17 @@ class StudentCalculatorGrade:
     def add_assignment(self, ass_name, ass_cat, weight, grade):
         # Check if grade is within the valid range (0-100)
         if grade < 0 or grade > 100:
-            print("Error: Grade must be between 0 and 100.")
+            self.reject("Grade must be between 0 and 100.")
             return
         
         # Check if weight is within the valid range (0-100)
         if weight < 0 or weight > 100:
-            print("Error: Weight must be between 0 and 100.")
+            self.reject("Weight must be between 0 and 100.")
             return
         
         # Check if total weight exceeds 100%
         if self.total_weight + weight > 100:
-            print("Error: Total weight of assignments must not exceed 100%.")
+            self.reject("Total weight of assignments must not exceed 100%.")
             return  # Stop adding the assignment if total weight exceeds 100%
 
         # Add assignment to the list
@@ -51,6 +56,10 @@ class StudentCalculatorGrade:
         self.total_weight += weight  # Update the total weight
         self.categories_present[ass_cat] = True  # Mark the category as present
 
+    # Report an assignment that failed validation; instrumentation counts the calls by reason
+    def reject(self, reason):
+        print(f"Error: {reason}")
+
     # Method to calculate final grades
     def calculate_fin_grade(self):
         ass_cat_scores = {"FA": 0, "SA": 0}  # Store weighted scores for categories
@@ -95,7 +104,7 @@ class StudentCalculatorGrade:
 
     # Method to calculate GPA
     def calculate_gpa(self, fin_grade):
-        return round((fin_grade / 100) * 5, 2)  # Convert final grade (out of 100) to GPA (out of 5)
+        return LINEAR_FIVE_POINT_SCALE.convert(fin_grade)  # Convert final grade (out of 100) to GPA (out of 5)
 
     # Method to determine pass or fail status of assignments
     def determine_pass_fail(self, form_grade, summ_grade):
@@ -0,0 +1,305 @@
+import ast
+import functools
+import importlib
+import json
+import sys
+import threading
+import time
+from bisect import bisect_left
+
+PREFIX = "summutive"
+# Upper bounds (seconds) of the duration histogram buckets
+BUCKETS = (0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0)
+
+# (module, attribute) of every function or method timed by enable()
+TIMED = (
+    ("plagiarism_app_detect", "read_essay"),
+    ("plagiarism_app_detect", "calculate_plagiarism"),
+    ("plagiarism_vocab", "calculate_plagiarism"),
+    ("plagiarism_cache", "TokenCache.read_essay"),
+    ("test2", "StudentCalculatorGrade.add_assignment"),
+    ("test2", "StudentCalculatorGrade.calculate_fin_grade"),
+    ("test2", "StudentCalculatorGrade.display_transcript"),
+    ("test2", "StudentCalculatorGrade.show_results"),
+    ("indivi", "StudentCalculateGrade.add_assignment"),
+    ("indivi", "StudentCalculateGrade.calculate_final_grade"),
+    ("individual_lab", "StudentCalculatorGrade.add_assignment"),
+    ("individual_lab", "StudentCalculatorGrade.calculate_fin_grade"),
+    ("test1", "Student.add_assignment"),
+    ("test1", "Student.calculate_scores"),
+    ("test1", "Student.generate_transcript"),
+    ("transcript_writer", "TranscriptWriter.write"),
+    ("transcript_writer", "TranscriptWriter.render_text"),
+    ("grade_batch", "calculate_cohort_grades"),
+    ("gradebook_db", "GradebookDB.add_assignment"),
+)
+# gradebook_import stages whose on_reject callback is counted
+REJECTING = (
+    ("gradebook_import", "parse_records"),
+    ("gradebook_import", "validate_rows"),
+)
+# Methods called once per rejected row, with the reason as their first argument
+REJECTION_HOOKS = (
+    ("test2", "StudentCalculatorGrade.reject"),
+    ("indivi", "StudentCalculateGrade.reject"),
+    ("individual_lab", "StudentCalculatorGrade.reject"),
+    ("test1", "Student.reject"),
+    ("gradebook_db", "GradebookDB.reject"),
+)
+
+
+# Counters and duration histograms, keyed by (metric name, sorted label pairs)
+class Stats:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.counters = {}
+        self.histograms = {}  # key -> [bucket counts..., +Inf count, sum]
+
+    def reset(self):
+        with self.lock:
+            self.counters.clear()
+            self.histograms.clear()
+
+    def count(self, name, amount=1, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + amount
+
+    def observe(self, name, seconds, **labels):
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = [0] * (len(BUCKETS) + 1) + [0.0]
+            histogram[bisect_left(BUCKETS, seconds)] += 1
+            histogram[-1] += seconds
+
+    # Plain dict copy of every metric, safe to read while other threads keep recording
+    def snapshot(self):
+        with self.lock:
+            counters = [{"name": name, "labels": dict(labels), "value": value}
+                        for (name, labels), value in sorted(self.counters.items())]
+            histograms = []
+            for (name, labels), histogram in sorted(self.histograms.items()):
+                calls = sum(histogram[:-1])
+                histograms.append({
+                    "name": name,
+                    "labels": dict(labels),
+                    "count": calls,
+                    "sum": histogram[-1],
+                    "mean": histogram[-1] / calls if calls else 0,
+                    "buckets": dict(zip([str(bound) for bound in BUCKETS] + ["+Inf"], histogram[:-1])),
+                })
+        return {"time": time.time(), "counters": counters, "histograms": histograms}
+
+    def to_json(self):
+        return json.dumps(self.snapshot(), indent=2)
+
+    # Prometheus text exposition format (buckets are cumulative there)
+    def to_prometheus(self):
+        snapshot = self.snapshot()
+        lines, typed = [], set()
+        for counter in snapshot["counters"]:
+            metric = f"{PREFIX}_{counter['name']}_total"
+            if metric not in typed:
+                typed.add(metric)
+                lines.append(f"# TYPE {metric} counter")
+            lines.append(f"{metric}{format_labels(counter['labels'])} {counter['value']}")
+        for histogram in snapshot["histograms"]:
+            metric = f"{PREFIX}_{histogram['name']}_seconds"
+            if metric not in typed:
+                typed.add(metric)
+                lines.append(f"# TYPE {metric} histogram")
+            cumulative = 0
+            for bound, calls in histogram["buckets"].items():
+                cumulative += calls
+                lines.append(f"{metric}_bucket{format_labels(dict(histogram['labels'], le=bound))} {cumulative}")
+            lines.append(f"{metric}_sum{format_labels(histogram['labels'])} {histogram['sum']}")
+            lines.append(f"{metric}_count{format_labels(histogram['labels'])} {histogram['count']}")
+        return "\n".join(lines) + "\n"
+
+
+def format_labels(labels):
+    if not labels:
+        return ""
+    pairs = []
+    for key, value in labels.items():
+        value = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        pairs.append(f'{key}="{value}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+STATS = Stats()
+patched = []  # (owner, attribute, original) for every wrapper installed by enable()
+exporter = None  # Running PeriodicExporter, if any
+
+
+def timed(name, function):
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        except Exception:
+            STATS.count("errors", function=name)
+            raise
+        finally:
+            STATS.observe("duration", time.perf_counter() - start, function=name)
+    return wrapper
+
+
+def counting_rejections(name, function):
+    @functools.wraps(function)
+    def wrapper(rows, on_reject):
+        def count_and_reject(line_no, reason):
+            STATS.count("rejected_rows", source=name, reason=reason)
+            on_reject(line_no, reason)
+        return function(rows, count_and_reject)
+    return wrapper
+
+
+def counting_calls(name, method):
+    @functools.wraps(method)
+    def wrapper(self, reason, *args, **kwargs):
+        STATS.count("rejected_rows", source=name, reason=reason)
+        return method(self, reason, *args, **kwargs)
+    return wrapper
+
+
+def replace(owner, attribute, wrapper):
+    patched.append((owner, attribute, getattr(owner, attribute)))
+    setattr(owner, attribute, wrapper)
+
+
+# Install the wrappers; until this is called the instrumented code runs untouched
+def enable():
+    if patched:
+        return
+    targets = [(module, attribute, None) for module, attribute in TIMED]
+    targets += [(module, attribute, counting_rejections) for module, attribute in REJECTING]
+    targets += [(module, attribute, counting_calls) for module, attribute in REJECTION_HOOKS]
+    for module_name, attribute, wrap in targets:
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError:
+            continue
+        name = f"{module_name}.{attribute}"
+        class_name, _, method_name = attribute.rpartition(".")
+        if class_name:
+            owner = getattr(module, class_name)
+            replace(owner, method_name, (wrap or timed)(name, getattr(owner, method_name)))
+            continue
+
+        # Functions are also rebound wherever another module imported them by name
+        original = getattr(module, attribute)
+        wrapper = (wrap or timed)(name, original)
+        for other in list(sys.modules.values()):
+            if getattr(other, "__dict__", {}).get(attribute) is original:
+                replace(other, attribute, wrapper)
+
+
+# Put the original functions back
+def disable():
+    while patched:
+        owner, attribute, original = patched.pop()
+        setattr(owner, attribute, original)
+
+
+def is_enabled():
+    return bool(patched)
+
+
+# Write the current stats to a file, as JSON or Prometheus text
+def export(path, fmt="json"):
+    if fmt not in ("json", "prometheus"):
+        raise ValueError("Format must be 'json' or 'prometheus'.")
+    text = STATS.to_json() if fmt == "json" else STATS.to_prometheus()
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(text)
+
+
+# Background thread that re-exports the stats every interval seconds
+class PeriodicExporter(threading.Thread):
+    def __init__(self, path, fmt="json", interval=10.0):
+        super().__init__(daemon=True)
+        self.path = path
+        self.fmt = fmt
+        self.interval = interval
+        self.stopped = threading.Event()
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            export(self.path, self.fmt)
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
+        export(self.path, self.fmt)  # Final stats at the end of the run
+
+
+def start_periodic_export(path, fmt="json", interval=10.0):
+    global exporter
+    stop_periodic_export()
+    exporter = PeriodicExporter(path, fmt, interval)
+    exporter.start()
+    return exporter
+
+
+def stop_periodic_export():
+    global exporter
+    if exporter is not None:
+        exporter.stop()
+        exporter = None
+
+
+# Run the `if __name__ == "__main__":` block of an imported module inside that module's namespace,
+# so it uses the classes enable() patched (runpy would define fresh, unpatched copies of them)
+def run_main_block(module):
+    with open(module.__file__, encoding="utf-8") as file:
+        tree = ast.parse(file.read(), module.__file__)
+    body = [
+        statement
+        for node in tree.body
+        if isinstance(node, ast.If) and ast.unparse(node.test) == "__name__ == '__main__'"
+        for statement in node.body
+    ]
+    exec(compile(ast.Module(body=body, type_ignores=[]), module.__file__, "exec"), vars(module))
+
+
+# Run another module's main() (or its script block, for modules like test1 that have no main)
+# with instrumentation on, then print or write the stats
+# Usage: instrumentation.py [--prometheus] [--output FILE] MODULE [ARGS...]
+def main():
+    args = sys.argv[1:]
+    fmt, output = "json", None
+    while args and args[0].startswith("--"):
+        option = args.pop(0)
+        if option == "--prometheus":
+            fmt = "prometheus"
+        elif option == "--output" and args:
+            output = args.pop(0)
+        else:
+            args = []
+    if not args:
+        print("Usage: instrumentation.py [--prometheus] [--output FILE] MODULE [ARGS...]")
+        return
+
+    enable()
+    module = importlib.import_module(args[0])
+    sys.argv = [module.__file__] + args[1:]
+    try:
+        if hasattr(module, "main"):
+            module.main()
+        else:
+            run_main_block(module)
+    finally:
+        disable()
+        if output:
+            export(output, fmt)
+            print(f"Stats written to {output}")
+        else:
+            print(STATS.to_json() if fmt == "json" else STATS.to_prometheus())
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,81 @@
 import re
+from functools import lru_cache
 
-def read_essay(filename):
+CHUNK_SIZE = 1 << 20  # Characters read per chunk when streaming an essay
+WORD_RE = re.compile(r'\b\w+\b')
+WORD_RUN_RE = re.compile(r'\w*')
+SIGMA_LOOKAHEAD = 1024  # Longest apostrophe/period run looked through for a Σ across chunks
+
+def is_word_char(char):
+    return char.isalnum() or char == '_'  # Same test as \w
+
+@lru_cache(maxsize=None)
+def is_case_ignorable(char):
+    """True for characters str.lower() looks through when choosing between σ and ς."""
+    return ('ΑΣ' + char).lower()[1] != ('ΑΣ' + char + 'Α').lower()[1]
+
+def carry_start(text, limit=SIGMA_LOOKAHEAD):
+    """Index where the part of text that may continue in the next chunk starts."""
+    cut = len(text)
+    while cut and is_word_char(text[cut - 1]):
+        cut -= 1
+    # A Σ followed only by apostrophes, periods and the like lowercases by the letter after them,
+    # so its word is kept back too (within limit, so a long run of them is not rescanned every chunk)
+    start = len(text)
+    while start and len(text) - start < limit and is_case_ignorable(text[start - 1]):
+        start -= 1
+    if start and text[start - 1] == 'Σ':
+        while start and is_word_char(text[start - 1]):
+            start -= 1
+        cut = min(cut, start)
+    return cut
+
+def context_before(text, limit=SIGMA_LOOKAHEAD):
+    """Trailing characters of text that str.lower() may look back at from the next chunk."""
+    start = len(text)
+    while start and len(text) - start < limit and is_case_ignorable(text[start - 1]):
+        start -= 1
+    return text[max(start - 1, 0):start + 1]  # One of the looked-through characters stands for all of them
+
+def lower_in_context(before, text, after):
+    """text.lower() as it comes out inside before + text + after (only Σ depends on its neighbours)."""
+    if 'Σ' not in text:
+        return text.lower()
+    lowered = (before + text + after).lower()
+    return lowered[len(before.lower()):len(lowered) - len(after.lower())]
+
+def iter_words(file, chunk_size=CHUNK_SIZE):
+    """Yields lowercase words from an open text file, one chunk at a time."""
+    before = ''
+    pieces, in_word = [], True  # The carried text, and whether it is all one run of word characters
+    while True:
+        chunk = file.read(chunk_size)
+        if not chunk:
+            break
+        if in_word and WORD_RUN_RE.fullmatch(chunk):
+            pieces.append(chunk)  # The word goes on: keep its pieces and join them once it ends
+            continue
+        text = ''.join(pieces) + chunk
+        cut = carry_start(text)
+        carry = text[cut:]
+        pieces, in_word = [carry], WORD_RUN_RE.fullmatch(carry) is not None
+        yield from WORD_RE.findall(lower_in_context(before, text[:cut], carry))
+        before = context_before(before + text[:cut])
+    carry = ''.join(pieces)
+    if carry:
+        yield from WORD_RE.findall(lower_in_context(before, carry, ''))
+
+def iter_word_matches(file):
+    """Yields (line number, match) for every word of an open text file."""
+    for line_no, line in enumerate(file, 1):
+        for match in WORD_RE.finditer(line):
+            yield line_no, match
+
+def read_essay(filename, chunk_size=CHUNK_SIZE):
     """Reads a text file and returns a set of words."""
     try:
         with open(filename, 'r', encoding='utf-8') as file:
-            text = file.read().lower()
-            words = set(re.findall(r'\b\w+\b', text))  # Extract words using regex
-            return words
+            return set(iter_words(file, chunk_size))  # Build the set without holding the whole text
     except FileNotFoundError:
         print(f"Error: {filename} not found.")
         return set()
@@ -0,0 +1,147 @@
+import os
+import struct
+import sys
+from array import array
+
+from plagiarism_app_detect import read_essay
+from plagiarism_corpus import prefix_length
+from plagiarism_vocab import Vocabulary
+
+RECORD_HEADER = struct.Struct('<II')  # Name length in bytes, number of word ids
+
+def truncate(path, size):
+    """Cuts a log back to its last complete record, so appends do not land after torn bytes."""
+    if os.path.getsize(path) > size:
+        os.truncate(path, size)
+
+class SubmissionArchive:
+    """Append-only archive that checks each new essay against everything received before."""
+
+    def __init__(self, directory):
+        os.makedirs(directory, exist_ok=True)
+        self.words_path = os.path.join(directory, 'words.txt')
+        self.essays_path = os.path.join(directory, 'essays.log')
+        self.vocabulary = Vocabulary()
+        self.names = []  # Essay number -> name
+        self.essays = []  # Essay number -> sorted array of word ids
+        self.postings = []  # Word id -> essay numbers containing it
+        self.load()
+        self.words_file = open(self.words_path, 'a', encoding='utf-8')
+        self.essays_file = open(self.essays_path, 'ab')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.words_file.close()
+        self.essays_file.close()
+
+    def load(self):
+        """Replays the vocabulary and essay logs into memory, cutting off a record torn by a crash."""
+        if os.path.exists(self.words_path):
+            good = 0
+            with open(self.words_path, 'rb') as file:
+                for line in file:
+                    if not line.endswith(b'\n'):
+                        break  # Last word cut short, it would run into the next word written
+                    self.vocabulary.intern(line[:-1].decode('utf-8'))
+                    self.postings.append(array('I'))
+                    good += len(line)
+            truncate(self.words_path, good)
+        if os.path.exists(self.essays_path):
+            good = 0
+            with open(self.essays_path, 'rb') as file:
+                while True:
+                    header = file.read(RECORD_HEADER.size)
+                    if len(header) < RECORD_HEADER.size:
+                        break  # End of log (or a record cut short by a crash)
+                    name_size, count = RECORD_HEADER.unpack(header)
+                    name = file.read(name_size)
+                    ids = array('I')
+                    data = file.read(count * ids.itemsize)
+                    if len(name) < name_size or len(data) < count * ids.itemsize:
+                        break
+                    ids.frombytes(data)
+                    if ids and max(ids) >= len(self.vocabulary):
+                        break  # Record written after words that never reached the disk
+                    self.index(name.decode('utf-8'), ids)
+                    good = file.tell()
+            truncate(self.essays_path, good)
+
+    def index(self, name, ids):
+        number = len(self.names)
+        self.names.append(name)
+        self.essays.append(ids)
+        for word_id in ids:
+            self.postings[word_id].append(number)
+
+    def check(self, words, threshold=50):
+        """Returns (name, percentage) for archived essays reaching the threshold against a word set."""
+        size = len(words)
+        if not size:
+            return []
+        ids = self.vocabulary.ids
+        # Probe the rarest words first, any essay reaching the threshold must share one of them
+        known = sorted((len(self.postings[ids[word]]), ids[word]) for word in words if word in ids)
+        unknown = size - len(known)
+        probe = known[:max(0, prefix_length(size, threshold) - unknown)]
+
+        min_size, max_size = threshold / 100 * size, (size * 100 / threshold if threshold else float('inf'))
+        candidates = set()
+        for _, word_id in probe:
+            for number in self.postings[word_id]:
+                if min_size <= len(self.essays[number]) <= max_size:
+                    candidates.add(number)
+
+        word_ids = {word_id for _, word_id in known}
+        matches = []
+        for number in candidates:
+            other = self.essays[number]
+            common = sum(1 for word_id in other if word_id in word_ids)
+            percentage = (common / (size + len(other) - common)) * 100
+            if percentage >= threshold:
+                matches.append((self.names[number], percentage))
+        matches.sort(key=lambda match: (-match[1], match[0]))
+        return matches
+
+    def add(self, name, words):
+        """Appends an essay to the logs and the in-memory index."""
+        for word in words:
+            if word not in self.vocabulary.ids:
+                self.vocabulary.intern(word)
+                self.postings.append(array('I'))
+                self.words_file.write(word + '\n')
+        self.words_file.flush()  # Words must be on disk before any record that uses them
+
+        ids = self.vocabulary.encode(words)
+        encoded = name.encode('utf-8')
+        self.essays_file.write(RECORD_HEADER.pack(len(encoded), len(ids)) + encoded + ids.tobytes())
+        self.essays_file.flush()
+        self.index(name, ids)
+
+    def submit(self, filename, threshold=50):
+        """Checks a new essay file against the archive, then archives it."""
+        words = read_essay(filename)
+        matches = self.check(words, threshold)
+        self.add(filename, words)
+        return matches
+
+def main():
+    if len(sys.argv) < 3:
+        print("Usage: plagiarism_archive.py ARCHIVE_DIR ESSAY [ESSAY ...]")
+        return
+
+    with SubmissionArchive(sys.argv[1]) as archive:
+        for filename in sys.argv[2:]:
+            matches = archive.submit(filename)
+            print(f"\n--- Submission Check: {filename} ---")
+            print(f"Archived Essays: {len(archive.names) - 1}")
+            print("Plagiarism Status:", "Plagiarism Detected" if matches else "No Plagiarism")
+            for name, percentage in matches:
+                print(f"- {name}: {percentage:.2f}%")
+
+if __name__ == "__main__":
+    main()
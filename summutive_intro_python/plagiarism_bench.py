@@ -0,0 +1,135 @@
+import argparse
+import itertools
+import json
+import os
+import platform
+import random
+import subprocess
+import tempfile
+import time
+import tracemalloc
+
+from plagiarism_app_detect import calculate_plagiarism, find_common_words, read_essay, search_word
+from plagiarism_corpus import find_similar_pairs
+
+def generate_corpus(directory, essays=200, words_per_essay=400, vocabulary=5000, copy_rate=0.1, seed=42):
+    """Writes a seeded synthetic corpus and returns the essay paths."""
+    rng = random.Random(seed)
+    words = [f"w{i}" for i in range(vocabulary)]
+    weights = list(itertools.accumulate(1 / rank for rank in range(1, vocabulary + 1)))  # Zipf-like usage
+
+    texts = []
+    for _ in range(essays):
+        text = rng.choices(words, cum_weights=weights, k=words_per_essay)
+        # Some essays copy a passage of an earlier essay
+        if texts and rng.random() < copy_rate:
+            source = rng.choice(texts)
+            length = words_per_essay // 2
+            start = rng.randrange(0, len(source) - length + 1)
+            at = rng.randrange(0, words_per_essay - length + 1)
+            text[at:at + length] = source[start:start + length]
+        texts.append(text)
+
+    paths = []
+    for number, text in enumerate(texts):
+        path = os.path.join(directory, f"essay-{number:06d}.txt")
+        with open(path, 'w', encoding='utf-8') as file:
+            for i in range(0, len(text), 15):
+                file.write(' '.join(text[i:i + 15]) + '\n')
+        paths.append(path)
+    return paths
+
+def measure(stage, items, unit, function):
+    """Runs a stage for wall time, then again under tracemalloc for peak memory."""
+    start = time.perf_counter()
+    result = function()
+    seconds = time.perf_counter() - start
+
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return result, {
+        'stage': stage,
+        'items': items,
+        'unit': unit,
+        'seconds': seconds,
+        'throughput': items / seconds if seconds else None,
+        'peak_bytes': peak,
+    }
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def run_benchmark(essays=200, words_per_essay=400, vocabulary=5000, copy_rate=0.1, seed=42, max_pairs=20000, searches=10000):
+    """Benchmarks every plagiarism stage on a synthetic corpus and returns the results."""
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        paths = generate_corpus(directory, essays, words_per_essay, vocabulary, copy_rate, seed)
+
+        word_sets, stats = measure('read_essay', len(paths), 'essays', lambda: [read_essay(path) for path in paths])
+        results.append(stats)
+
+        pairs = list(itertools.islice(itertools.combinations(word_sets, 2), max_pairs))
+        _, stats = measure('find_common_words', len(pairs), 'pairs', lambda: [find_common_words(a, b) for a, b in pairs])
+        results.append(stats)
+        _, stats = measure('calculate_plagiarism', len(pairs), 'pairs', lambda: [calculate_plagiarism(a, b) for a, b in pairs])
+        results.append(stats)
+
+        rng = random.Random(seed)
+        lookups = [(f"w{rng.randrange(vocabulary * 2)}", rng.randrange(len(word_sets))) for _ in range(searches)]
+        _, stats = measure('search_word', len(lookups), 'lookups', lambda: [
+            search_word(word, word_sets[i], word_sets[i - 1]) for word, i in lookups
+        ])
+        results.append(stats)
+
+        corpus = dict(zip(paths, word_sets))
+        total_pairs = len(paths) * (len(paths) - 1) // 2
+        _, stats = measure('find_similar_pairs', total_pairs, 'pairs', lambda: find_similar_pairs(corpus))
+        results.append(stats)
+
+    return {
+        'commit': git_commit(),
+        'python': platform.python_version(),
+        'parameters': {
+            'essays': essays, 'words_per_essay': words_per_essay, 'vocabulary': vocabulary,
+            'copy_rate': copy_rate, 'seed': seed, 'max_pairs': max_pairs, 'searches': searches,
+        },
+        'results': results,
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the plagiarism detector on a synthetic corpus.")
+    parser.add_argument('--essays', type=int, default=200)
+    parser.add_argument('--words', type=int, default=400, help="words per essay")
+    parser.add_argument('--vocabulary', type=int, default=5000)
+    parser.add_argument('--copy-rate', type=float, default=0.1)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--max-pairs', type=int, default=20000)
+    parser.add_argument('--searches', type=int, default=10000)
+    parser.add_argument('--output', help="write the results as JSON to this file")
+    args = parser.parse_args()
+
+    report = run_benchmark(args.essays, args.words, args.vocabulary, args.copy_rate, args.seed, args.max_pairs, args.searches)
+
+    print("\n--- Plagiarism Benchmark ---")
+    print(f"{'Stage':<22}{'Items':>10}{'Seconds':>10}{'Per second':>14}{'Peak MB':>10}")
+    for stats in report['results']:
+        throughput = f"{stats['throughput']:.0f}" if stats['throughput'] else "-"
+        print(f"{stats['stage']:<22}{stats['items']:>10}{stats['seconds']:>10.3f}{throughput:>14}"
+              f"{stats['peak_bytes'] / 1e6:>10.2f}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump(report, file, indent=2)
+        print(f"Results written to {args.output}")
+
+if __name__ == "__main__":
+    main()
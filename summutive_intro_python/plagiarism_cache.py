@@ -0,0 +1,108 @@
+import hashlib
+import os
+import sqlite3
+import zlib
+
+from plagiarism_app_detect import read_essay
+
+DEFAULT_CACHE_FILE = '.essay_cache.sqlite3'
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024  # Total size of cached word blobs before eviction
+
+def file_digest(filename):
+    """Returns the BLAKE2b digest of a file's contents."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(filename, 'rb') as file:
+        for block in iter(lambda: file.read(1 << 20), b''):
+            digest.update(block)
+    return digest.digest()
+
+def pack_words(words):
+    """Packs a word set into a compressed blob."""
+    return zlib.compress('\n'.join(sorted(words)).encode('utf-8'))
+
+def unpack_words(blob):
+    """Unpacks a blob made by pack_words back into a word set."""
+    text = zlib.decompress(blob).decode('utf-8')
+    return set(text.split('\n')) if text else set()
+
+class TokenCache:
+    """Persistent cache of read_essay results with LRU eviction."""
+
+    def __init__(self, path=DEFAULT_CACHE_FILE, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS essays ("
+            "path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, digest BLOB, "
+            "words BLOB, nbytes INTEGER, used INTEGER)"
+        )
+        self.connection.execute("CREATE INDEX IF NOT EXISTS essays_used ON essays (used)")
+        row = self.connection.execute("SELECT COALESCE(MAX(used), 0), COALESCE(SUM(nbytes), 0) FROM essays").fetchone()
+        self.clock, self.total_bytes = row  # Last access stamp and bytes currently cached
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Writes pending access stamps and closes the cache."""
+        self.connection.commit()
+        self.connection.close()
+
+    def tick(self):
+        self.clock += 1
+        return self.clock
+
+    def read_essay(self, filename):
+        """Returns the word set of an essay, tokenizing it only if it changed since last time."""
+        path = os.path.abspath(filename)
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return read_essay(filename)  # Let read_essay report the missing file
+
+        row = self.connection.execute(
+            "SELECT size, mtime_ns, digest, words FROM essays WHERE path = ?", (path,)
+        ).fetchone()
+        if row is not None:
+            size, mtime_ns, digest, blob = row
+            if (size, mtime_ns) == (stat.st_size, stat.st_mtime_ns):
+                self.connection.execute("UPDATE essays SET used = ? WHERE path = ?", (self.tick(), path))
+                return unpack_words(blob)
+            # The file was touched, reuse the entry if its contents are unchanged
+            if size == stat.st_size and file_digest(path) == digest:
+                self.connection.execute(
+                    "UPDATE essays SET mtime_ns = ?, used = ? WHERE path = ?",
+                    (stat.st_mtime_ns, self.tick(), path),
+                )
+                return unpack_words(blob)
+
+        words = read_essay(filename)
+        self.store(path, stat, file_digest(path), words)
+        return words
+
+    def store(self, path, stat, digest, words):
+        """Saves an essay's words and evicts the least recently used entries over the limit."""
+        blob = pack_words(words)
+        old = self.connection.execute("SELECT nbytes FROM essays WHERE path = ?", (path,)).fetchone()
+        if old is not None:
+            self.total_bytes -= old[0]
+        self.connection.execute(
+            "INSERT OR REPLACE INTO essays VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (path, stat.st_size, stat.st_mtime_ns, digest, blob, len(blob), self.tick()),
+        )
+        self.total_bytes += len(blob)
+
+        while self.total_bytes > self.max_bytes:
+            oldest = self.connection.execute(
+                "SELECT path, nbytes FROM essays ORDER BY used LIMIT 1"
+            ).fetchone()
+            if oldest is None or oldest[0] == path:
+                break  # Never evict the entry that was just stored
+            self.connection.execute("DELETE FROM essays WHERE path = ?", (oldest[0],))
+            self.total_bytes -= oldest[1]
+        self.connection.commit()
@@ -0,0 +1,78 @@
+import math
+import os
+import sys
+from collections import Counter, defaultdict
+
+from plagiarism_app_detect import read_essay
+
+def read_corpus(directory, suffix='.txt'):
+    """Reads every essay in a directory and returns a dict of file name to word set."""
+    names = sorted(name for name in os.listdir(directory) if name.endswith(suffix))
+    return {name: read_essay(os.path.join(directory, name)) for name in names}
+
+def rank_words(corpus):
+    """Ranks words from rarest to most common across the corpus."""
+    counts = Counter()
+    for words in corpus.values():
+        counts.update(words)
+    ordered = sorted(counts, key=lambda word: (counts[word], word))
+    return {word: rank for rank, word in enumerate(ordered)}
+
+def prefix_length(size, threshold):
+    """Returns how many of an essay's rarest words must be indexed for a threshold."""
+    # Two essays scoring >= threshold share at least ceil(t * size) words,
+    # so one of them always appears among the first size - ceil(t * size) + 1
+    min_overlap = math.ceil(threshold / 100 * size - 1e-9)
+    return min(size, size - min_overlap + 1)
+
+def find_similar_pairs(corpus, threshold=50):
+    """Finds every pair of essays whose plagiarism percentage reaches the threshold."""
+    ranks = rank_words(corpus)
+    # Visit essays from smallest to largest so the size filter only looks back
+    names = sorted(corpus, key=lambda name: (len(corpus[name]), name))
+    index = defaultdict(list)  # Word -> essays (so far) that have it in their prefix
+    pairs = []
+
+    for name in names:
+        words = corpus[name]
+        size = len(words)
+        if not size:
+            continue
+        min_size = threshold / 100 * size
+        prefix = sorted(words, key=ranks.__getitem__)[:prefix_length(size, threshold)]
+
+        # Walk the postings of the prefix words to collect candidate essays
+        candidates = set()
+        for word in prefix:
+            for other in index[word]:
+                if len(corpus[other]) >= min_size:
+                    candidates.add(other)
+            index[word].append(name)
+
+        # Only candidates are scored, everything else is below the threshold
+        for other in candidates:
+            other_words = corpus[other]
+            common = len(words & other_words)
+            percentage = (common / (size + len(other_words) - common)) * 100
+            if percentage >= threshold:
+                first, second = sorted((name, other))
+                pairs.append((first, second, percentage))
+
+    pairs.sort(key=lambda pair: (-pair[2], pair[0], pair[1]))
+    return pairs
+
+def main():
+    directory = sys.argv[1] if len(sys.argv) > 1 else '.'
+    threshold = float(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+    corpus = read_corpus(directory)
+    pairs = find_similar_pairs(corpus, threshold)
+
+    print("\n--- Corpus Plagiarism Report ---")
+    print(f"Essays Compared: {len(corpus)}")
+    print(f"Pairs at or above {threshold:.2f}%: {len(pairs)}")
+    for first, second, percentage in pairs:
+        print(f"{first} <-> {second}: {percentage:.2f}%")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+import sqlite3
+import sys
+from array import array
+from collections import defaultdict
+
+from plagiarism_app_detect import WORD_RE, iter_word_matches
+
+DEFAULT_INDEX_FILE = 'essays.index.sqlite3'
+
+def unpack_positions(blob):
+    """Unpacks a postings blob into (word position, line number) pairs."""
+    values = array('I')
+    values.frombytes(blob)
+    return list(zip(values[0::2], values[1::2]))
+
+class PositionalIndex:
+    """Persistent word -> essay index that records where every occurrence is."""
+
+    def __init__(self, path=DEFAULT_INDEX_FILE):
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("CREATE TABLE IF NOT EXISTS essays (id INTEGER PRIMARY KEY, name TEXT UNIQUE)")
+        # Clustered on (word, essay) so exact and prefix lookups are a single range scan
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS postings ("
+            "word TEXT, essay INTEGER, count INTEGER, positions BLOB, "
+            "PRIMARY KEY (word, essay)) WITHOUT ROWID"
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.connection.commit()
+        self.connection.close()
+
+    def add_essays(self, filenames):
+        """Indexes essays in one transaction, replacing any earlier copy with the same name."""
+        with self.connection:
+            for filename in filenames:
+                occurrences = defaultdict(lambda: array('I'))  # Word -> position, line, position, line...
+                try:
+                    with open(filename, 'r', encoding='utf-8') as file:
+                        for position, (line_no, match) in enumerate(iter_word_matches(file)):
+                            occurrences[match.group().lower()].extend((position, line_no))
+                except FileNotFoundError:
+                    print(f"Error: {filename} not found.")
+                    continue
+
+                row = self.connection.execute("SELECT id FROM essays WHERE name = ?", (filename,)).fetchone()
+                if row is not None:
+                    self.connection.execute("DELETE FROM postings WHERE essay = ?", (row[0],))
+                    essay_id = row[0]
+                else:
+                    essay_id = self.connection.execute("INSERT INTO essays (name) VALUES (?)", (filename,)).lastrowid
+                self.connection.executemany(
+                    "INSERT INTO postings VALUES (?, ?, ?, ?)",
+                    ((word, essay_id, len(values) // 2, values.tobytes()) for word, values in occurrences.items()),
+                )
+
+    def search(self, words):
+        """Looks up many words at once and returns word -> [(essay, count, [(position, line)])]."""
+        results = {}
+        # Split the query the way essays are tokenized, so 'cat,' or "don't" find what was indexed
+        for word in WORD_RE.findall(' '.join(words).lower()):
+            results[word] = [
+                (name, count, unpack_positions(blob))
+                for name, count, blob in self.connection.execute(
+                    "SELECT e.name, p.count, p.positions FROM postings p JOIN essays e ON e.id = p.essay "
+                    "WHERE p.word = ? ORDER BY e.name",
+                    (word,),
+                )
+            ]
+        return results
+
+    def search_prefix(self, prefix, limit=100):
+        """Returns (word, essays containing it, total occurrences) for words starting with prefix."""
+        prefix = prefix.lower()
+        return self.connection.execute(
+            "SELECT word, COUNT(*), SUM(count) FROM postings WHERE word >= ? AND word < ? "
+            "GROUP BY word ORDER BY word LIMIT ?",
+            (prefix, prefix + '\U0010ffff', limit),
+        ).fetchall()
+
+    def search_phrase(self, phrase):
+        """Returns (essay, [(position, line)]) for every essay containing the exact phrase."""
+        words = WORD_RE.findall(phrase.lower())
+        if not words:
+            return []
+        postings = self.search(words)
+
+        # Only essays that contain every word can contain the phrase
+        by_word = [{name: positions for name, _, positions in postings[word]} for word in words]
+        matches = []
+        for name in sorted(set(by_word[0]).intersection(*by_word[1:])):
+            later = [{position for position, _ in found[name]} for found in by_word[1:]]
+            starts = [
+                (position, line_no) for position, line_no in by_word[0][name]
+                if all(position + offset in positions for offset, positions in enumerate(later, 1))
+            ]
+            if starts:
+                matches.append((name, starts))
+        return matches
+
+def main():
+    index = PositionalIndex(sys.argv[1] if len(sys.argv) > 1 else DEFAULT_INDEX_FILE)
+    if len(sys.argv) > 2:
+        index.add_essays(sys.argv[2:])
+
+    query = input("Enter words to search (prefix*, or \"a phrase\"): ").strip()
+    if query.startswith('"') and query.endswith('"'):
+        for name, starts in index.search_phrase(query.strip('"')):
+            print(f"{name}: {len(starts)} match(es) on lines {sorted({line_no for _, line_no in starts})}")
+    elif query.endswith('*'):
+        for word, essays, total in index.search_prefix(query[:-1]):
+            print(f"{word}: {total} occurrence(s) in {essays} essay(s)")
+    else:
+        for word, found in index.search(query.split()).items():
+            print(f"Word '{word}' found in {len(found)} essay(s)")
+            for name, count, positions in found:
+                print(f"- {name}: {count} time(s), lines {sorted({line_no for _, line_no in positions})}")
+    index.close()
+
+if __name__ == "__main__":
+    main()
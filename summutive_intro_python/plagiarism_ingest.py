@@ -0,0 +1,79 @@
+import os
+import sys
+from array import array
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from plagiarism_app_detect import CHUNK_SIZE, iter_words
+
+LoadedCorpus = namedtuple('LoadedCorpus', ['vocabulary', 'essays', 'errors'])
+IngestError = namedtuple('IngestError', ['filename', 'message'])
+
+def tokenize_file(filename):
+    """Tokenizes one essay in a worker and returns its unique words packed in one string."""
+    try:
+        with open(filename, 'r', encoding='utf-8') as file:
+            words = set(iter_words(file, CHUNK_SIZE))
+    except (OSError, UnicodeDecodeError) as error:
+        return None, f"{type(error).__name__}: {error}"
+    # A single newline-joined string pickles far faster than a set of strings
+    return '\n'.join(sorted(words)), None
+
+def list_essays(directory, suffix='.txt'):
+    """Returns the essay paths of a directory in a stable order."""
+    return [os.path.join(directory, name) for name in sorted(os.listdir(directory)) if name.endswith(suffix)]
+
+def load_essays(filenames, workers=None, batch_size=16):
+    """Tokenizes essays over a process pool and interns their words to integer ids."""
+    filenames = list(filenames)  # Iterated twice below, once by map and once by zip
+    vocabulary = []  # Word id -> word
+    word_ids = {}  # Word -> word id
+    essays = []  # (filename, sorted array of word ids) in input order
+    errors = []
+
+    if workers == 1:
+        results = map(tokenize_file, filenames)
+        pool = None
+    else:
+        pool = ProcessPoolExecutor(max_workers=workers)
+        results = pool.map(tokenize_file, filenames, chunksize=batch_size)  # Keeps input order
+
+    try:
+        for filename, (packed, message) in zip(filenames, results):
+            if message is not None:
+                errors.append(IngestError(filename, message))
+                continue
+            ids = array('I')
+            if packed:
+                for word in packed.split('\n'):
+                    word_id = word_ids.get(word)
+                    if word_id is None:
+                        word_id = word_ids[word] = len(vocabulary)
+                        vocabulary.append(word)
+                    ids.append(word_id)
+            essays.append((filename, array('I', sorted(ids))))
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    return LoadedCorpus(vocabulary, essays, errors)
+
+def to_word_set(ids, vocabulary):
+    """Turns an array of word ids back into the set read_essay would return."""
+    return {vocabulary[word_id] for word_id in ids}
+
+def main():
+    directory = sys.argv[1] if len(sys.argv) > 1 else '.'
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else None
+
+    corpus = load_essays(list_essays(directory), workers)
+
+    print("\n--- Essay Ingestion Report ---")
+    print(f"Essays Loaded: {len(corpus.essays)}")
+    print(f"Distinct Words: {len(corpus.vocabulary)}")
+    print(f"Errors: {len(corpus.errors)}")
+    for error in corpus.errors:
+        print(f"- {error.filename}: {error.message}")
+
+if __name__ == "__main__":
+    main()
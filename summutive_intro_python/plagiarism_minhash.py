@@ -0,0 +1,125 @@
+import hashlib
+import random
+import sys
+from array import array
+from collections import defaultdict
+
+from plagiarism_app_detect import calculate_plagiarism
+from plagiarism_corpus import read_corpus
+
+MERSENNE_PRIME = (1 << 61) - 1  # Modulus for the universal hash permutations
+MAX_HASH = (1 << 32) - 1
+
+def word_hash(word):
+    """Returns a 32-bit hash of a word that is stable across runs."""
+    return int.from_bytes(hashlib.blake2b(word.encode('utf-8'), digest_size=4).digest(), 'little')
+
+class MinHashIndex:
+    """Locality-sensitive index of MinHash signatures for near-duplicate essays."""
+
+    def __init__(self, num_perm=128, bands=32, seed=1):
+        # More permutations give better estimates, more bands find lower similarities
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands.")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        rng = random.Random(seed)
+        self.perms = [(rng.randrange(1, MERSENNE_PRIME), rng.randrange(0, MERSENNE_PRIME)) for _ in range(num_perm)]
+        self.signatures = {}  # Essay name -> signature
+        self.buckets = [defaultdict(list) for _ in range(bands)]  # Band key -> essay names
+
+    def threshold(self):
+        """Returns the similarity (in %) at which a pair has a 50% chance of being a candidate."""
+        return (1 / self.bands) ** (1 / self.rows) * 100
+
+    def signature(self, words):
+        """Computes the MinHash signature of a word set."""
+        hashes = [word_hash(word) for word in words]
+        signature = array('I', [MAX_HASH]) * self.num_perm
+        if not hashes:
+            return signature
+        for i, (a, b) in enumerate(self.perms):
+            signature[i] = min((a * h + b) % MERSENNE_PRIME for h in hashes) & MAX_HASH
+        return signature
+
+    def band_keys(self, signature):
+        """Splits a signature into one hashable key per band."""
+        rows = self.rows
+        return [signature[i * rows:(i + 1) * rows].tobytes() for i in range(self.bands)]
+
+    def add(self, name, words):
+        """Adds an essay's word set to the index."""
+        signature = self.signature(words)
+        self.signatures[name] = signature
+        if not words:
+            return  # Empty essays never count as plagiarism, keep them out of the buckets
+        for bucket, key in zip(self.buckets, self.band_keys(signature)):
+            bucket[key].append(name)
+
+    def candidates(self, signature):
+        """Returns the indexed essays sharing at least one band with a signature."""
+        found = set()
+        for bucket, key in zip(self.buckets, self.band_keys(signature)):
+            found.update(bucket.get(key, ()))
+        return found
+
+    def estimate(self, first, second):
+        """Estimates the plagiarism percentage of two indexed essays from their signatures."""
+        sig1, sig2 = self.signatures[first], self.signatures[second]
+        return sum(1 for x, y in zip(sig1, sig2) if x == y) / self.num_perm * 100
+
+    def query(self, words, threshold=50):
+        """Returns indexed essays estimated to reach the threshold against a word set."""
+        signature = self.signature(words)
+        results = []
+        for name in self.candidates(signature):
+            other = self.signatures[name]
+            estimate = sum(1 for x, y in zip(signature, other) if x == y) / self.num_perm * 100
+            if estimate >= threshold:
+                results.append((name, estimate))
+        results.sort(key=lambda result: (-result[1], result[0]))
+        return results
+
+    def find_similar_pairs(self, threshold=50, corpus=None):
+        """Finds candidate pairs reaching the threshold, rescored exactly if the corpus is given."""
+        seen = set()
+        pairs = []
+        for bucket in self.buckets:
+            for names in bucket.values():
+                if len(names) < 2:
+                    continue
+                for i, first in enumerate(names):
+                    for second in names[i + 1:]:
+                        pair = (first, second) if first < second else (second, first)
+                        if pair in seen:
+                            continue
+                        seen.add(pair)
+                        if corpus is not None:
+                            percentage = calculate_plagiarism(corpus[pair[0]], corpus[pair[1]])
+                        else:
+                            percentage = self.estimate(*pair)
+                        if percentage >= threshold:
+                            pairs.append((pair[0], pair[1], percentage))
+        pairs.sort(key=lambda pair: (-pair[2], pair[0], pair[1]))
+        return pairs
+
+def main():
+    directory = sys.argv[1] if len(sys.argv) > 1 else '.'
+    threshold = float(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+    corpus = read_corpus(directory)
+    index = MinHashIndex()
+    for name, words in corpus.items():
+        index.add(name, words)
+    pairs = index.find_similar_pairs(threshold, corpus)
+
+    print("\n--- Near-Duplicate Report (MinHash) ---")
+    print(f"Essays Indexed: {len(corpus)}")
+    print(f"Candidate Threshold: {index.threshold():.2f}%")
+    print(f"Pairs at or above {threshold:.2f}%: {len(pairs)}")
+    for first, second, percentage in pairs:
+        print(f"{first} <-> {second}: {percentage:.2f}%")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+from array import array
+
+try:
+    import numpy as np  # Optional: vectorized fast path
+except ImportError:
+    np = None
+
+class Vocabulary:
+    """Shared word <-> integer id table so essays can be stored as id arrays."""
+
+    def __init__(self, words=()):
+        self.words = []  # Word id -> word
+        self.ids = {}  # Word -> word id
+        for word in words:
+            self.intern(word)
+
+    def __len__(self):
+        return len(self.words)
+
+    def intern(self, word):
+        """Returns the id of a word, adding it to the vocabulary if it is new."""
+        word_id = self.ids.get(word)
+        if word_id is None:
+            word_id = self.ids[word] = len(self.words)
+            self.words.append(word)
+        return word_id
+
+    def encode(self, words):
+        """Turns a word set into a sorted array of word ids."""
+        return array('I', sorted(self.intern(word) for word in words))
+
+    def decode(self, ids):
+        """Turns an array of word ids back into a word set."""
+        return {self.words[word_id] for word_id in ids}
+
+class InternedEssay:
+    """An essay stored as a sorted array of word ids (4 bytes per word)."""
+
+    __slots__ = ('name', 'ids')
+
+    def __init__(self, name, ids):
+        self.name = name
+        self.ids = ids
+
+    def __len__(self):
+        return len(self.ids)
+
+def merge_count(first, second):
+    """Counts the ids two sorted id arrays share by walking both in step."""
+    count = i = j = 0
+    while i < len(first) and j < len(second):
+        a, b = first[i], second[j]
+        if a == b:
+            count += 1
+            i += 1
+            j += 1
+        elif a < b:
+            i += 1
+        else:
+            j += 1
+    return count
+
+def common_word_count(first, second):
+    """Counts the words two interned essays share without building a set."""
+    if np is not None:
+        return np.intersect1d(np.asarray(first.ids), np.asarray(second.ids), assume_unique=True).size
+    return merge_count(first.ids, second.ids)
+
+def calculate_plagiarism(first, second):
+    """Calculates the plagiarism percentage of two interned essays."""
+    common = common_word_count(first, second)
+    total_unique = len(first) + len(second) - common
+    return (common / total_unique) * 100 if total_unique else 0
+
+def intern_corpus(corpus, vocabulary=None):
+    """Interns a {name: word set} corpus and returns the vocabulary and essays."""
+    vocabulary = vocabulary if vocabulary is not None else Vocabulary()
+    essays = [InternedEssay(name, vocabulary.encode(words)) for name, words in corpus.items()]
+    return vocabulary, essays
+
+def from_loaded_corpus(loaded):
+    """Wraps the result of plagiarism_ingest.load_essays without re-interning any words."""
+    vocabulary = Vocabulary()
+    vocabulary.words = loaded.vocabulary
+    vocabulary.ids = {word: word_id for word_id, word in enumerate(loaded.vocabulary)}
+    return vocabulary, [InternedEssay(name, ids) for name, ids in loaded.essays]
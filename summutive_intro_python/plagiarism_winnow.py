@@ -0,0 +1,155 @@
+import sys
+import zlib
+from array import array
+from collections import Counter, defaultdict, deque, namedtuple
+
+from plagiarism_app_detect import iter_word_matches
+
+K_GRAM = 5  # Words per shingle
+WINDOW = 4  # Shingles per winnowing window, copies of K_GRAM + WINDOW - 1 words are always caught
+BASE = 1000003
+MASK = (1 << 64) - 1
+
+Span = namedtuple('Span', ['start_line', 'start_col', 'end_line', 'end_col'])
+Passage = namedtuple('Passage', ['first', 'second', 'words'])
+
+class Fingerprint:
+    """Winnowed k-gram fingerprints of an essay with the position of every word."""
+
+    def __init__(self, name, k=K_GRAM, window=WINDOW):
+        self.name = name
+        self.k = k
+        self.window = window
+        self.hashes = array('Q')  # Selected shingle hashes
+        self.positions = array('I')  # Word index where each selected shingle starts
+        self.lines = array('I')  # Line number of every word
+        self.starts = array('I')  # Column where every word starts
+        self.ends = array('I')  # Column just after every word ends
+
+    def span(self, first_word, last_word):
+        """Returns the line/column range covering words first_word..last_word."""
+        return Span(self.lines[first_word], self.starts[first_word], self.lines[last_word], self.ends[last_word])
+
+def fingerprint_essay(filename, k=K_GRAM, window=WINDOW):
+    """Reads an essay line by line and returns its winnowed fingerprints."""
+    fp = Fingerprint(filename, k, window)
+    shift = pow(BASE, k - 1, 1 << 64)  # Weight of the word leaving the rolling hash
+    recent = deque()  # Hashes of the last k words
+    candidates = deque()  # (hash, shingle) pairs that can still be a window minimum
+    rolling = 0
+    shingle = 0
+
+    def select(item):
+        if not fp.positions or fp.positions[-1] != item[1]:
+            fp.hashes.append(item[0])
+            fp.positions.append(item[1])
+
+    try:
+        with open(filename, 'r', encoding='utf-8') as file:
+            for line_no, match in iter_word_matches(file):
+                fp.lines.append(line_no)
+                fp.starts.append(match.start())
+                fp.ends.append(match.end())
+
+                word_hash = zlib.crc32(match.group().lower().encode('utf-8'))
+                if len(recent) == k:
+                    rolling = (rolling - recent.popleft() * shift) & MASK
+                recent.append(word_hash)
+                rolling = (rolling * BASE + word_hash) & MASK
+                if len(recent) < k:
+                    continue
+
+                # Keep candidates increasing so the front is the rightmost window minimum
+                while candidates and candidates[-1][0] >= rolling:
+                    candidates.pop()
+                candidates.append((rolling, shingle))
+                if candidates[0][1] <= shingle - window:
+                    candidates.popleft()
+                if shingle >= window - 1:
+                    select(candidates[0])
+                shingle += 1
+    except FileNotFoundError:
+        print(f"Error: {filename} not found.")
+        return fp
+
+    if 0 < shingle < window:
+        select(candidates[0])  # Short essays still get one fingerprint
+    return fp
+
+def find_passages(fp1, fp2):
+    """Finds passages of fp1 copied in fp2 and returns them longest first."""
+    where = defaultdict(list)
+    for hash_value, position in zip(fp2.hashes, fp2.positions):
+        where[hash_value].append(position)
+
+    # Group matching shingles by diagonal so each copied run lines up
+    diagonals = defaultdict(list)
+    for hash_value, i in zip(fp1.hashes, fp1.positions):
+        for j in where.get(hash_value, ()):
+            diagonals[j - i].append(i)
+
+    passages = []
+    k, gap = fp1.k, fp1.window
+    for offset, starts in diagonals.items():
+        starts.sort()
+        run_start = run_end = starts[0]
+        for i in starts[1:] + [None]:
+            if i is not None and i <= run_end + gap:
+                run_end = i
+                continue
+            last = run_end + k - 1
+            passages.append(Passage(
+                fp1.span(run_start, last),
+                fp2.span(run_start + offset, last + offset),
+                last - run_start + 1,
+            ))
+            if i is not None:
+                run_start = run_end = i
+
+    passages.sort(key=lambda passage: (-passage.words, passage.first))
+    return passages
+
+class FingerprintIndex:
+    """Inverted index of fingerprint hashes to the essays containing them."""
+
+    def __init__(self):
+        self.names = []  # Essay id -> name
+        self.postings = defaultdict(lambda: array('I'))  # Hash -> essay ids
+
+    def add(self, fp):
+        """Indexes an essay's fingerprints and returns its essay id."""
+        essay_id = len(self.names)
+        self.names.append(fp.name)
+        for hash_value in set(fp.hashes):
+            self.postings[hash_value].append(essay_id)
+        return essay_id
+
+    def candidates(self, fp, min_shared=1):
+        """Returns (name, shared fingerprints) for indexed essays sharing fingerprints with fp."""
+        shared = Counter()
+        for hash_value in set(fp.hashes):
+            postings = self.postings.get(hash_value)
+            if postings is not None:
+                shared.update(postings)
+        results = [(self.names[essay_id], count) for essay_id, count in shared.items() if count >= min_shared]
+        results.sort(key=lambda result: (-result[1], result[0]))
+        return results
+
+def main():
+    first = sys.argv[1] if len(sys.argv) > 1 else 'essay-1.txt'
+    second = sys.argv[2] if len(sys.argv) > 2 else 'essay-2.txt'
+
+    fp1 = fingerprint_essay(first)
+    fp2 = fingerprint_essay(second)
+    passages = find_passages(fp1, fp2)
+
+    print("\n--- Copied Passage Report ---")
+    print(f"Fingerprints: {len(fp1.hashes)} in {first}, {len(fp2.hashes)} in {second}")
+    print(f"Matching Passages: {len(passages)}")
+    for passage in passages:
+        a, b = passage.first, passage.second
+        print(f"{passage.words} words: {first} {a.start_line}:{a.start_col}-{a.end_line}:{a.end_col}"
+              f" <-> {second} {b.start_line}:{b.start_col}-{b.end_line}:{b.end_col}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+import math
+
+
+# Exact running sum that supports adding and removing values in O(1)
+# It keeps non-overlapping partial sums (Shewchuk's algorithm, the same idea as math.fsum),
+# so value() always equals math.fsum() of the values currently in the sum, with no drift
+class RunningSum:
+    __slots__ = ("partials",)
+
+    def __init__(self, values=()):
+        self.partials = []
+        for value in values:
+            self.add(value)
+
+    # Add a value to the sum
+    def add(self, x):
+        partials = self.partials
+        i = 0
+        for y in partials:
+            if abs(x) < abs(y):
+                x, y = y, x
+            hi = x + y
+            lo = y - (hi - x)  # Exact rounding error of x + y
+            if lo:
+                partials[i] = lo
+                i += 1
+            x = hi
+        partials[i:] = [x]
+
+    # Remove a value that was added earlier
+    def subtract(self, x):
+        self.add(-x)
+
+    # Correctly rounded total of the values in the sum
+    def value(self):
+        return math.fsum(self.partials)
+
+    # value() and the (rounded) part of the exact total that value() leaves out, for callers that
+    # keep adding to the total elsewhere and need it rounded the way this sum would round it
+    def value_and_remainder(self):
+        total = math.fsum(self.partials)
+        return total, math.fsum(self.partials + [-total])
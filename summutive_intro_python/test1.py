@@ -1,4 +1,9 @@
+from gpa_scale import FIVE_POINT_SCALE
+
+
 class Assignment:
+    __slots__ = ('name', 'assignment_type', 'score', 'weight')  # No per-instance __dict__
+
     def __init__(self, name, assignment_type, score, weight):
         self.name = name
         self.assignment_type = assignment_type
@@ -21,7 +26,10 @@ class Student:
             self.summative_total_weight += assignment.weight
             self.assignments.append(assignment)
         else:
-            print(f"⚠️ Cannot add {assignment.name}: Weight exceeds limit for {assignment.assignment_type} assignments.")
+            self.reject(f"Weight exceeds limit for {assignment.assignment_type} assignments.", assignment)
+
+    def reject(self, reason, assignment):
+        print(f"⚠️ Cannot add {assignment.name}: {reason}")
 
     def calculate_scores(self):
         formative_score, summative_score = 0, 0
@@ -45,18 +53,7 @@ class Student:
         return formative_score, summative_score, overall_grade, gpa, status
 
     def convert_to_gpa(self, percentage):
-        if percentage >= 85:
-            return 5.0
-        elif percentage >= 75:
-            return 4.0
-        elif percentage >= 65:
-            return 3.0
-        elif percentage >= 50:
-            return 2.0
-        elif percentage >= 40:
-            return 1.0
-        else:
-            return 0.0  # Failing grade
+        return FIVE_POINT_SCALE.convert(percentage)
 
     def check_progression(self, formative_score, summative_score):
         formative_average = 50  # Define passing average for formative
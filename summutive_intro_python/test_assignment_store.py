@@ -0,0 +1,38 @@
+import contextlib
+import io
+
+import pytest
+
+from assignment_store import AssignmentStore
+from test2 import Assignment, StudentCalculatorGrade
+
+
+def run_edits(calculator):
+    with contextlib.redirect_stdout(io.StringIO()):
+        calculator.add_assignment("quiz", "FA", 20, 70)
+        calculator.add_assignment("lab", "formative", 30, 55.5)
+        calculator.add_assignment("exam", "SA", 40, 81)
+        calculator.update_assignment("lab", "SA", 35, 90)
+        calculator.update_assignment("quiz", "bad", 10, 10)  # Rejected, nothing changes
+        calculator.remove_assignment("exam")
+        calculator.add_assignment("project", "FA", 25, 64)
+        return calculator.calculate_fin_grade()
+
+
+def test_store_stands_in_for_assignments_list():
+    plain = StudentCalculatorGrade("amy", "C1")
+    stored = StudentCalculatorGrade("amy", "C1")
+    stored.assignments = AssignmentStore()
+    assert run_edits(stored) == run_edits(plain)
+    assert [(a.name, a.ass_cat, a.weight, a.grade) for a in stored.assignments] == \
+        [(a.name, a.ass_cat, a.weight, a.grade) for a in plain.assignments]
+
+
+def test_remove_deletes_only_that_record():
+    store = AssignmentStore()
+    for name in ["a", "b", "c"]:
+        store.append(Assignment(name, "FA", 10, 50))
+    store.remove(store[1])
+    assert [assignment.name for assignment in store] == ["a", "c"]
+    with pytest.raises(ValueError):
+        store.remove(Assignment("a", "FA", 10, 50))
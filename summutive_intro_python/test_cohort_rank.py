@@ -0,0 +1,75 @@
+import random
+from bisect import bisect_left, insort
+
+import pytest
+
+import cohort_rank
+from cohort_query import CohortQueryIndex
+from cohort_rank import CohortRankIndex, SortedGrades
+
+
+def test_remove_missing_key_raises():
+    grades = SortedGrades()
+    for key in [(50, "amy"), (70, "bob"), (90, "cy")]:
+        grades.add(key)
+    for missing in [(60, "dan"), (95, "eve"), (10, "fay")]:
+        with pytest.raises(KeyError):
+            grades.remove(missing)
+    assert list(grades.descending()) == [(90, "cy"), (70, "bob"), (50, "amy")]
+    assert len(grades) == 3
+
+
+def test_query_index_remove_missing_record_keeps_neighbours():
+    index = CohortQueryIndex()
+    index.add("C1", "amy", "quiz", "FA", 40, 10)
+    index.add("C1", "bob", "quiz", "FA", 45, 10)
+    with pytest.raises(KeyError):
+        index.remove("C1", "amy", "quiz", "FA", 42, 10)
+    assert [record.student_name for record in index.below("FA", 50, "C1")] == ["amy", "bob"]
+
+
+# Brute-force check of the buckets and Fenwick tree against a plain sorted list
+def test_sorted_grades_matches_sorted_list(monkeypatch):
+    monkeypatch.setattr(cohort_rank, "BUCKET_SIZE", 4)  # Many small buckets, so splits and merges happen often
+    rng = random.Random(9)
+    grades, expected = SortedGrades(), []
+    for step in range(3000):
+        if expected and rng.random() < 0.4:
+            key = rng.choice(expected)
+            grades.remove(key)
+            expected.remove(key)
+        else:
+            key = (rng.randint(0, 40), f"s{rng.randint(0, 30)}")
+            grades.add(key)
+            insort(expected, key)
+        assert len(grades) == len(expected)
+        probe = (rng.randint(-1, 41),)
+        assert grades.count_below(probe) == bisect_left(expected, probe)
+        assert list(grades.iter_below(probe)) == expected[:bisect_left(expected, probe)]
+        assert list(grades.iter_from(probe)) == expected[bisect_left(expected, probe):]
+        if expected:
+            position = rng.randrange(len(expected))
+            assert grades.at(position) == expected[position]
+    assert list(grades.descending()) == expected[::-1]
+
+
+def test_rank_index_matches_brute_force():
+    rng = random.Random(4)
+    index, grades = CohortRankIndex(), {}
+    for _ in range(2000):
+        class_name, student_name = f"C{rng.randint(0, 2)}", f"s{rng.randint(0, 40)}"
+        grade = None if rng.random() < 0.2 else rng.choice([50.0, 62.5, 75.0, rng.uniform(0, 100)])
+        index.update(class_name, student_name, grade)
+        if grade is None:
+            grades.pop((class_name, student_name), None)
+        else:
+            grades[(class_name, student_name)] = grade
+
+    for (class_name, student_name), grade in grades.items():
+        cohort = [other for (other_class, _), other in grades.items() if other_class == class_name]
+        assert index.rank(class_name, student_name) == sum(other > grade for other in cohort) + 1
+        assert index.percentile(class_name, student_name) == sum(other < grade for other in cohort) / len(cohort) * 100
+    for class_name in ["C0", "C1", "C2"]:
+        cohort = sorted(((grade, student_name) for (other_class, student_name), grade in grades.items()
+                         if other_class == class_name), reverse=True)
+        assert index.top(class_name, 5) == [(student_name, grade) for grade, student_name in cohort[:5]]
@@ -0,0 +1,25 @@
+import contextlib
+import io
+import random
+
+from cohort_runner import run_cohorts
+from gradebook_import import GradeRow
+
+
+def random_rows(seed, rows):
+    rng = random.Random(seed)
+    return [
+        GradeRow(f"s{rng.randint(0, 40)}", f"C{rng.randint(0, 5)}", f"a{number}", rng.choice(["FA", "SA"]),
+                 rng.uniform(0, 10), rng.uniform(0, 100))
+        for number in range(rows)
+    ]
+
+
+def test_workers_do_not_change_the_reports():
+    rows = random_rows(15, 2000)
+    with contextlib.redirect_stdout(io.StringIO()):
+        single = run_cohorts(rows, workers=1)
+        pooled = run_cohorts(rows, workers=2)
+    assert [report.class_name for report in single] == sorted({row.class_name for row in rows})
+    assert pooled == single
+    assert all(report.transcripts for report in single)
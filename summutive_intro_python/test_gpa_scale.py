@@ -0,0 +1,83 @@
+import random
+
+import pytest
+
+from gpa_scale import FIVE_POINT_SCALE, FOUR_POINT_SCALE, LINEAR_FIVE_POINT_SCALE, LinearScale, StepScale
+
+
+# The if/elif chains the scales replaced (test2 / lab-1, test1, indivi / individual_lab)
+def four_point_chain(percentage):
+    if percentage >= 85:
+        return 4.0
+    elif percentage >= 75:
+        return 3.5
+    elif percentage >= 65:
+        return 3.0
+    elif percentage >= 50:
+        return 2.5
+    elif percentage >= 40:
+        return 2.0
+    else:
+        return 0.0
+
+
+def five_point_chain(percentage):
+    if percentage >= 85:
+        return 5.0
+    elif percentage >= 75:
+        return 4.0
+    elif percentage >= 65:
+        return 3.0
+    elif percentage >= 50:
+        return 2.0
+    elif percentage >= 40:
+        return 1.0
+    else:
+        return 0.0
+
+
+def linear_chain(percentage):
+    return round((percentage / 100) * 5, 2)
+
+
+def grades_to_check():
+    rng = random.Random(16)
+    grades = [rng.uniform(-5, 105) for _ in range(20000)]
+    grades += [round(rng.uniform(0, 100), 1) for _ in range(20000)]
+    grades += [step / 1000 for step in range(100001)]  # Every half-way case of round(..., 2) on the linear scale
+    for edge in [0, 40, 50, 65, 75, 85, 100]:
+        grades += [edge, float(edge), edge - 1e-9, edge + 1e-9]
+    return grades
+
+
+@pytest.mark.parametrize("scale, chain", [
+    (FOUR_POINT_SCALE, four_point_chain),
+    (FIVE_POINT_SCALE, five_point_chain),
+    (LINEAR_FIVE_POINT_SCALE, linear_chain),
+])
+def test_scales_match_the_original_chains(scale, chain, engine):
+    grades = grades_to_check()
+    expected = [chain(grade) for grade in grades]
+    assert [scale.convert(grade) for grade in grades] == expected
+    assert list(scale.convert_many(grades)) == expected
+
+
+def test_linear_rounding_digits(engine):
+    grades = [step / 7 for step in range(-70, 800)] + [float("nan"), float("inf"), 1e300]
+    for scale in (LinearScale(4, 0), LinearScale(4.3, 1), LinearScale(10, 3), LinearScale(5, 15)):
+        expected = [scale.convert(grade) for grade in grades]
+        assert [repr(gpa) for gpa in scale.convert_many(grades)] == [repr(gpa) for gpa in expected]
+
+
+def test_min_percentage():
+    assert FOUR_POINT_SCALE.min_percentage(3.5) == 75
+    assert FOUR_POINT_SCALE.min_percentage(0.0) == float("-inf")
+    assert FOUR_POINT_SCALE.min_percentage(4.5) is None
+    assert LINEAR_FIVE_POINT_SCALE.min_percentage(2.5) == 50
+
+
+def test_step_scale_rejects_bad_tables():
+    with pytest.raises(ValueError):
+        StepScale([50, 40], [0.0, 1.0, 2.0])
+    with pytest.raises(ValueError):
+        StepScale([40, 50], [0.0, 1.0])
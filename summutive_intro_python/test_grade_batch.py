@@ -0,0 +1,71 @@
+import contextlib
+import io
+import math
+import random
+
+import pytest
+
+import grade_batch
+from grade_batch import calculate_cohort_grades, columns_from_calculators, segment_grades
+
+
+def expected(calculator):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return calculator.calculate_fin_grade()
+
+
+def assert_matches(calculators, results):
+    for student_id, calculator in enumerate(calculators):
+        overall, formative, summative, gpa = expected(calculator)
+        got = (results.overall[student_id], results.formative[student_id],
+               results.summative[student_id], results.gpa[student_id])
+        if overall is None:
+            assert all(math.isnan(value) for value in got)
+        else:
+            assert got == (overall, formative, summative, gpa)
+
+
+@pytest.mark.parametrize("value", ["uniform", "decimal", "awkward"])
+def test_matches_calculate_fin_grade(engine, random_calculators, value):
+    rng = random.Random(7)
+    values = {
+        "uniform": lambda: rng.uniform(0, 9),
+        "decimal": lambda: round(rng.uniform(0, 9), 1),
+        "awkward": lambda: rng.choice([0, 0.1, 1e-20, 1e-300, 8.5, 1 / 3]),
+    }[value]
+    calculators = random_calculators(rng, 300, values, values)
+    columns = columns_from_calculators(calculators)
+    assert_matches(calculators, calculate_cohort_grades(*columns, num_students=len(calculators)))
+
+
+def test_row_order_does_not_matter(engine, random_calculators):
+    rng = random.Random(3)
+    calculators = random_calculators(rng, 200, lambda: rng.uniform(0, 9), lambda: rng.uniform(0, 9))
+    rows = list(zip(*columns_from_calculators(calculators)))
+    rng.shuffle(rows)
+    columns = [type(column)(column.typecode, values)
+               for column, values in zip(columns_from_calculators(calculators), zip(*rows))]
+    assert_matches(calculators, calculate_cohort_grades(*columns, num_students=len(calculators)))
+
+
+def test_small_blocks(engine, random_calculators, monkeypatch):
+    monkeypatch.setattr(grade_batch, "CHUNK_ROWS", 5)
+    rng = random.Random(11)
+    calculators = random_calculators(rng, 100, lambda: rng.uniform(0, 9), lambda: rng.uniform(0, 9))
+    columns = columns_from_calculators(calculators)
+    assert_matches(calculators, calculate_cohort_grades(*columns, num_students=len(calculators)))
+
+
+def test_segment_grades_reads_offsets(engine, random_calculators):
+    rng = random.Random(5)
+    calculators = random_calculators(rng, 50, lambda: rng.uniform(0, 9), lambda: rng.uniform(0, 9))
+    student_ids, categories, weights, grades = columns_from_calculators(calculators)
+    offsets = [0]
+    for calculator in calculators:
+        offsets.append(offsets[-1] + len(calculator.assignments))
+    assert_matches(calculators, segment_grades(offsets, categories, weights, grades))
+
+
+def test_students_without_rows(engine):
+    results = calculate_cohort_grades([], [], [], [], num_students=3)
+    assert len(results.overall) == 3 and all(math.isnan(value) for value in results.overall)
@@ -0,0 +1,80 @@
+import contextlib
+import io
+import math
+import random
+
+import pytest
+
+import grade_scenario
+from grade_scenario import INFEASIBLE, Aggregates, aggregates_from_calculators, required_grade, solve_scenarios
+from test2 import StudentCalculatorGrade
+
+
+def test_required_grade_within_reach():
+    assert required_grade(10, 20, 20, 50) == 50.0  # 10/20 so far, needs (50 * 40 - 1000) / 20
+    assert required_grade(20, 20, 20, 50) == 0.0
+    assert required_grade(0, 0, 10, 50) == 50.0
+
+
+def test_required_grade_above_100_is_infeasible():
+    assert required_grade(2, 40, 10, 50) == INFEASIBLE  # Would need 230 on the remaining 10%
+    assert required_grade(5, 20, 0, 50) == INFEASIBLE
+    assert required_grade(10, 20, 0, 50) == 0.0
+
+
+def test_solve_scenarios_target_out_of_reach(engine):
+    aggregates = Aggregates([2.0], [40.0], [30.0], [40.0])
+    result = solve_scenarios(aggregates, [10.0], [10.0], target_gpa=4.0)
+    assert result.fa_required[0] == INFEASIBLE and not result.can_pass[0]
+    assert math.isinf(result.target_required[0])
+
+
+def copy_with(calculator, extra):
+    copy = StudentCalculatorGrade(calculator.student_name, calculator.class_name)
+    for assignment in calculator.assignments:
+        copy.add_assignment(assignment.name, assignment.ass_cat, assignment.weight, assignment.grade)
+    for ass_name, ass_cat, weight, grade in extra:
+        if weight > 0:
+            copy.add_assignment(ass_name, ass_cat, weight, grade)
+    return copy
+
+
+# Add the solved grades back through add_assignment: each feasible answer must be enough
+def test_solved_grades_round_trip_through_the_calculator(engine, random_calculators):
+    rng = random.Random(20)
+    calculators = random_calculators(rng, 3000, lambda: rng.uniform(0, 12), lambda: rng.uniform(0, 100), (1, 5))
+    fa_remaining = [rng.uniform(0, (100 - calculator.total_weight) / 2) for calculator in calculators]
+    sa_remaining = [rng.uniform(0, (100 - calculator.total_weight) / 2) for calculator in calculators]
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = solve_scenarios(aggregates_from_calculators(calculators), fa_remaining, sa_remaining, target_gpa=3.0)
+
+        feasible = 0
+        for student, calculator in enumerate(calculators):
+            for category, needed, left in (("FA", result.fa_required[student], fa_remaining[student]),
+                                           ("SA", result.sa_required[student], sa_remaining[student])):
+                if needed > 100:
+                    continue
+                feasible += 1
+                finished = copy_with(calculator, [("rest", category, left, needed)])
+                weight = finished.ass_weights[category].value()
+                assert (finished.ass_cat_scores[category].value() / weight) * 100 >= 50
+
+            needed = result.target_required[student]
+            if needed <= 100:
+                finished = copy_with(calculator, [("fa", "FA", fa_remaining[student], needed),
+                                                  ("sa", "SA", sa_remaining[student], needed)])
+                _, _, _, gpa = finished.calculate_fin_grade()
+                assert gpa >= 3.0
+    assert feasible > 1000
+
+
+def test_engines_agree(monkeypatch):
+    pytest.importorskip("numpy")
+    rng = random.Random(8)
+    size = 2000
+    aggregates = Aggregates(*([rng.uniform(0, 20) for _ in range(size)] for _ in range(4)))
+    fa_remaining = [rng.choice([0.0, rng.uniform(0, 30)]) for _ in range(size)]
+    sa_remaining = [rng.choice([0.0, rng.uniform(0, 30)]) for _ in range(size)]
+    vectorized = solve_scenarios(aggregates, fa_remaining, sa_remaining, target_gpa=2.5)
+    monkeypatch.setattr(grade_scenario, "np", None)
+    assert solve_scenarios(aggregates, fa_remaining, sa_remaining, target_gpa=2.5) == vectorized
@@ -0,0 +1,86 @@
+import asyncio
+import json
+
+import grade_service
+from grade_service import GradeService
+from test2 import StudentCalculatorGrade
+
+AMY = {"id": 1, "student_name": "amy", "class_name": "C1", "assignments": [
+    {"ass_name": "quiz", "ass_cat": "FA", "weight": 40, "grade": 80},
+    {"ass_name": "exam", "ass_cat": "SA", "weight": 60, "grade": 70},
+]}
+
+
+# Send request lines over one connection, all at once, and return the decoded response lines
+def exchange(lines, **options):
+    async def run():
+        service = GradeService(**options)
+        batcher = asyncio.create_task(service.run_batcher())
+        server = await asyncio.start_server(service.handle_client, "127.0.0.1", 0, limit=grade_service.LINE_LIMIT)
+        try:
+            reader, writer = await asyncio.open_connection(*server.sockets[0].getsockname()[:2])
+            writer.write(b"".join(line.encode("utf-8") + b"\n" for line in lines))
+            writer.write_eof()
+            responses = [json.loads(line) async for line in reader]
+            writer.close()
+            return responses
+        finally:
+            batcher.cancel()
+            server.close()
+            await server.wait_closed()
+
+    return asyncio.run(run())
+
+
+def test_round_trip():
+    (response,) = exchange([json.dumps(AMY)])
+    assert response == {"id": 1, "overall": 74.0, "formative": 80.0, "summative": 70.0, "gpa": 3.0,
+                        "status": "Pass", "student_name": "amy", "class_name": "C1"}
+
+
+def test_errors_are_answered_without_dropping_the_connection():
+    overflow = ('{"id": 3, "student_name": "amy", "assignments": [{"ass_name": "quiz", "ass_cat": "FA", "weight": '
+                + str(10**400) + ', "grade": 80}]}')
+    responses = exchange([
+        json.dumps(AMY),
+        "not json",
+        overflow,
+        json.dumps({"id": 4, "assignments": []}),
+        json.dumps(dict(AMY, id=5)),
+    ])
+    assert [response["id"] for response in responses] == [1, None, 3, 4, 5]
+    assert responses[0]["gpa"] == responses[4]["gpa"] == 3.0
+    assert responses[1] == {"id": None, "error": "Request is not valid JSON."}
+    assert responses[2]["rejected"] == [{"index": 0, "reason": "Weight and grade must be numbers."}]
+    assert responses[3] == {"id": 4, "error": "Missing field(s): student_name."}
+
+
+def test_parser_failures_become_error_responses(monkeypatch):
+    def broken_parse(request):
+        raise OverflowError("int too large to convert to float")
+
+    monkeypatch.setattr(grade_service, "parse_request", broken_parse)
+    responses = exchange([json.dumps(AMY)])
+    assert responses == [{"id": 1, "error": "Invalid request: int too large to convert to float"}]
+
+
+def test_pipelined_responses_keep_request_order():
+    requests = []
+    for request_id in range(300):
+        grade = request_id % 101
+        assignments = [{"ass_name": "quiz", "ass_cat": "FA", "weight": 50, "grade": grade}]
+        if request_id % 3:
+            assignments.append({"ass_name": "exam", "ass_cat": "SA", "weight": 50, "grade": grade})
+        requests.append(json.dumps({"id": request_id, "student_name": f"s{request_id}", "assignments": assignments}))
+    responses = exchange(requests, batch_size=7, max_in_flight=16)
+    assert [response["id"] for response in responses] == list(range(300))
+    for request, response in zip(requests, responses):
+        request = json.loads(request)
+        calculator = StudentCalculatorGrade(request["student_name"], "")
+        for assignment in request["assignments"]:
+            calculator.add_assignment(*assignment.values())
+        overall = calculator.calculate_fin_grade()[0]
+        if overall is None:
+            assert "error" in response
+        else:
+            assert (response["student_name"], response["overall"]) == (request["student_name"], overall)
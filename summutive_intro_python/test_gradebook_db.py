@@ -0,0 +1,53 @@
+import random
+
+import gradebook_db
+from gradebook_db import GradebookDB
+from gradebook_import import GradeRow
+
+
+def test_student_results_by_student_name_only(tmp_path):
+    with GradebookDB(str(tmp_path / "grades.sqlite3")) as db:
+        for class_name in ["C1", "C2"]:
+            for student_name in ["amy", "bob"]:
+                db.add_assignment(class_name, student_name, "quiz", "FA", 40, 80)
+                db.add_assignment(class_name, student_name, "exam", "SA", 60, 70)
+        results = db.student_results(student_name="amy")
+    assert [(class_name, student_name) for class_name, student_name, *_ in results] == [("C1", "amy"), ("C2", "amy")]
+
+
+def test_load_rows_counts_stored_weight(tmp_path, monkeypatch, capsys):
+    monkeypatch.setattr(gradebook_db, "BATCH_SIZE", 2)
+    with GradebookDB(str(tmp_path / "grades.sqlite3")) as db:
+        db.add_assignment("C1", "amy", "quiz", "FA", 60, 80)
+        rows = [
+            GradeRow("amy", "C1", "exam", "SA", 30, 70),
+            GradeRow("bob", "C1", "quiz", "FA", 50, 90),
+            GradeRow("amy", "C1", "project", "SA", 20, 60),  # Would make 110% with the stored quiz
+            GradeRow("bob", "C1", "exam", "SA", 50, 75),
+            GradeRow("bob", "C1", "extra", "SA", 1, 75),  # Past 100% with bob's rows from earlier batches
+        ]
+        assert db.load_rows(rows) == 3
+        assert db.total_weight("C1", "amy") == 90
+        assert db.total_weight("C1", "bob") == 100
+    assert capsys.readouterr().out.count("Total weight cannot exceed 100%") == 2
+
+
+# The SQL aggregates must give exactly what the rebuilt StudentCalculatorGrade reports
+def test_student_results_match_calculators(tmp_path, capsys):
+    rng = random.Random(21)
+    with GradebookDB(str(tmp_path / "grades.sqlite3")) as db:
+        for student in range(300):
+            for number in range(rng.randint(2, 12)):
+                db.add_assignment("C1", f"s{student}", f"a{number}", rng.choice(["FA", "SA"]),
+                                  rng.uniform(0.1, 9), rng.uniform(0, 100))
+        results = db.student_results("C1")
+        for class_name, student_name, *grades in results:
+            expected = db.load_calculator(class_name, student_name).calculate_fin_grade()
+            assert tuple(grades) == expected
+
+
+def test_student_name_lookup_uses_an_index(tmp_path):
+    with GradebookDB(str(tmp_path / "grades.sqlite3")) as db:
+        sql = gradebook_db.STUDENT_TOTALS_SQL + " WHERE student_name = ? GROUP BY class_name, student_name"
+        plan = " ".join(row[-1] for row in db.connection.execute("EXPLAIN QUERY PLAN " + sql, ("amy",)))
+    assert "USING INDEX assignments_student_name" in plan
@@ -0,0 +1,84 @@
+import json
+import random
+
+from gradebook_import import GradeRow, import_gradebook, load_calculators, parse_records, validate_rows
+from test2 import StudentCalculatorGrade
+
+
+def collect(rejections):
+    return lambda line_no, reason: rejections.append((line_no, reason))
+
+
+def test_jsonl_rows_that_cannot_be_parsed_are_rejected_one_by_one(tmp_path):
+    path = tmp_path / "grades.jsonl"
+    lines = [
+        json.dumps({"student_name": "amy", "ass_name": "quiz", "ass_cat": "FA", "weight": 40, "grade": 80}),
+        '{"student_name": "amy", "ass_name": "big", "ass_cat": "FA", "weight": ' + str(10**400) + ', "grade": 80}',
+        "not json",
+        json.dumps({"student_name": "amy", "ass_name": "lab", "ass_cat": "FA", "weight": "NaN", "grade": 80}),
+        json.dumps({"student_name": "amy", "ass_name": "exam", "ass_cat": "SA", "weight": 60}),
+        json.dumps({"student_name": "amy", "ass_name": "exam", "ass_cat": "sa", "weight": 60, "grade": "70"}),
+    ]
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    rejections = []
+    rows = list(import_gradebook(str(path), collect(rejections)))
+    assert rows == [GradeRow("amy", "", "quiz", "FA", 40.0, 80.0), GradeRow("amy", "", "exam", "SA", 60.0, 70.0)]
+    assert rejections == [
+        (2, "Weight and grade must be numbers."),
+        (3, "Row is not valid JSON."),
+        (4, "Weight and grade must be numbers."),
+        (5, "Missing field(s): grade."),
+    ]
+
+
+def test_csv_line_numbers(tmp_path):
+    path = tmp_path / "grades.csv"
+    path.write_text(
+        "student_name,class_name,ass_name,ass_cat,weight,grade\n"
+        "amy,C1,quiz,Formative,40,80\n"
+        "amy,C1,exam,XX,60,70\n",
+        encoding="utf-8",
+    )
+    rejections = []
+    rows = list(import_gradebook(str(path), collect(rejections)))
+    assert rows == [GradeRow("amy", "C1", "quiz", "FA", 40.0, 80.0)]
+    assert rejections == [(3, "Invalid category. Use 'FA' (Formative) or 'SA' (Summative).")]
+
+
+# validate_rows must accept and reject exactly the rows add_assignment does, for the same reasons
+def test_validation_matches_add_assignment(capsys):
+    rng = random.Random(12)
+    records = [
+        (line_no, {
+            "student_name": rng.choice(["amy", "bob", "cy"]), "class_name": rng.choice(["C1", "C2"]),
+            "ass_name": f"a{line_no}", "ass_cat": rng.choice(["FA", "sa", "Formative", "Summative", "XA"]),
+            "weight": rng.choice([-5, 0, 10, 25.5, 40, 100, 101]), "grade": rng.choice([-1, 0, 55.5, 100, 100.5]),
+        })
+        for line_no in range(1, 2001)
+    ]
+    rejections = []
+    accepted = list(validate_rows(parse_records(records, collect(rejections)), collect(rejections)))
+
+    calculators = {}
+    for _, record in records:
+        key = (record["class_name"], record["student_name"])
+        calculator = calculators.setdefault(key, StudentCalculatorGrade(*reversed(key)))
+        calculator.add_assignment(record["ass_name"], record["ass_cat"], float(record["weight"]), float(record["grade"]))
+    printed = [line.removeprefix("⚠️ ") for line in capsys.readouterr().out.splitlines()]
+
+    assert [reason for _, reason in rejections] == printed
+    stored = sorted((c.class_name, c.student_name, a.name, a.ass_cat, a.weight, a.grade)
+                    for c in calculators.values() for a in c.assignments)
+    assert sorted((r.class_name, r.student_name, r.ass_name, r.ass_cat, r.weight, r.grade) for r in accepted) == stored
+
+
+def test_load_calculators(tmp_path):
+    path = tmp_path / "grades.jsonl"
+    path.write_text(
+        json.dumps({"student_name": "amy", "class_name": "C1", "ass_name": "quiz", "ass_cat": "FA", "weight": 40, "grade": 80}) + "\n"
+        + json.dumps({"student_name": "amy", "class_name": "C1", "ass_name": "exam", "ass_cat": "SA", "weight": 60, "grade": 70}) + "\n",
+        encoding="utf-8",
+    )
+    calculators = load_calculators(str(path), collect([]))
+    assert list(calculators) == [("C1", "amy")]
+    assert calculators["C1", "amy"].calculate_fin_grade()[0] == 74
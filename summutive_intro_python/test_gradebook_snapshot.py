@@ -0,0 +1,26 @@
+import contextlib
+import io
+import math
+import random
+
+from gradebook_snapshot import GradebookSnapshot, write_snapshot
+
+
+def test_snapshot_matches_calculators(tmp_path, engine, random_calculators):
+    rng = random.Random(3)
+    calculators = random_calculators(rng, 300, lambda: rng.uniform(0, 15), lambda: rng.uniform(0, 100), (0, 8))
+    path = str(tmp_path / "cohort.snap")
+    write_snapshot(path, calculators)
+    with GradebookSnapshot(path) as snapshot, contextlib.redirect_stdout(io.StringIO()):
+        results = snapshot.cohort_grades()
+        for student_id, calculator in enumerate(calculators):
+            expected = calculator.calculate_fin_grade()
+            assert snapshot.calculate_fin_grade(student_id) == expected
+            assert snapshot.student(student_id) == (calculator.student_name, calculator.class_name)
+            assert [row[0] for row in snapshot.assignments(student_id)] == [a.name for a in calculator.assignments]
+            if expected[0] is None:
+                assert math.isnan(results.overall[student_id])
+            else:
+                got = (results.overall[student_id], results.formative[student_id],
+                       results.summative[student_id], results.gpa[student_id])
+                assert got == expected
@@ -0,0 +1,67 @@
+import builtins
+import sys
+
+import pytest
+
+import indivi
+import instrumentation
+import test2
+from gradebook_db import GradebookDB
+from instrumentation import STATS
+
+
+@pytest.fixture
+def enabled():
+    STATS.reset()
+    instrumentation.enable()
+    yield
+    instrumentation.disable()
+    STATS.reset()
+
+
+def counter(name, **labels):
+    for entry in STATS.snapshot()["counters"]:
+        if entry["name"] == name and entry["labels"] == labels:
+            return entry["value"]
+    return 0
+
+
+def test_gradebook_db_rejections_are_counted(enabled, tmp_path, capsys):
+    with GradebookDB(str(tmp_path / "grades.sqlite3")) as db:
+        db.add_assignment("C1", "amy", "quiz", "FA", 60, 80)
+        db.add_assignment("C1", "amy", "exam", "XX", 20, 70)
+        db.add_assignment("C1", "amy", "exam", "SA", 50, 70)
+    source = "gradebook_db.GradebookDB.reject"
+    assert counter("rejected_rows", source=source, reason="Invalid category. Use 'FA' (Formative) or 'SA' (Summative).") == 1
+    assert counter("rejected_rows", source=source, reason="Total weight cannot exceed 100%.") == 1
+    durations = {entry["labels"]["function"]: entry["count"] for entry in STATS.snapshot()["histograms"]}
+    assert durations["gradebook_db.GradebookDB.add_assignment"] == 3
+
+
+def test_main_runs_modules_without_main(monkeypatch, capsys):
+    answers = iter(["Amy", "quiz", "Formative", "40", "30", "exam", "Summative", "80", "70", "done", "asc"])
+    monkeypatch.setattr(builtins, "input", lambda prompt="": next(answers))
+    monkeypatch.setattr(sys, "argv", ["instrumentation.py", "test1"])
+    STATS.reset()
+    instrumentation.main()
+    assert not instrumentation.is_enabled()
+    assert counter("rejected_rows", source="test1.Student.reject",
+                   reason="Weight exceeds limit for Summative assignments.") == 1
+    assert "Results for Amy" in capsys.readouterr().out
+    STATS.reset()
+
+
+def test_calculator_rejections_are_counted_per_branch(enabled, capsys):
+    calculator = test2.StudentCalculatorGrade("amy", "C1")
+    calculator.add_assignment("quiz", "FA", 60, 80)
+    calculator.add_assignment("lab", "FA", 20, 101)
+    calculator.add_assignment("exam", "SA", 50, 70)
+    calculator.update_assignment("quiz", "XX", 60, 80)
+    other = indivi.StudentCalculateGrade()
+    other.add_assignment("quiz", "FA", 120, 80)
+    assert counter("rejected_rows", source="test2.StudentCalculatorGrade.reject", reason="Grade must be between 0 and 100.") == 1
+    assert counter("rejected_rows", source="test2.StudentCalculatorGrade.reject", reason="Total weight cannot exceed 100%.") == 1
+    assert counter("rejected_rows", source="test2.StudentCalculatorGrade.reject",
+                   reason="Invalid category. Use 'FA' (Formative) or 'SA' (Summative).") == 1
+    assert counter("rejected_rows", source="indivi.StudentCalculateGrade.reject", reason="Weight must be between 0 and 100.") == 1
+    assert "Error: Weight must be between 0 and 100." in capsys.readouterr().out
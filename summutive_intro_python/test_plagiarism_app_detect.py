@@ -0,0 +1,39 @@
+import io
+import random
+import time
+
+from plagiarism_app_detect import WORD_RE, iter_words
+
+def words_at_once(text):
+    return WORD_RE.findall(text.lower())
+
+def test_chunked_matches_whole_text():
+    rng = random.Random(1)
+    alphabet = 'abΣσςΑİʰ_1 \n.,\'’:-é́'
+    for _ in range(300):
+        text = ''.join(rng.choice(alphabet) for _ in range(rng.randint(0, 60)))
+        for chunk_size in (1, 2, 3, 7, 64):
+            assert list(iter_words(io.StringIO(text), chunk_size)) == words_at_once(text)
+
+def test_words_across_chunk_boundaries():
+    text = 'Plagiarism detection, word-by-word; ΤΕΛΟΣ.Α ΟΔΟΣ end'
+    assert list(iter_words(io.StringIO(text), 4)) == words_at_once(text)
+
+def test_text_without_whitespace_stays_linear():
+    text = 'ab,' * 200000
+    start = time.perf_counter()
+    words = list(iter_words(io.StringIO(text), 64))
+    assert len(words) == 200000
+    assert time.perf_counter() - start < 5  # Carrying everything since the last space took minutes
+
+def test_word_much_longer_than_a_chunk():
+    for text in ['x' * 10000 + 'Σ.' + 'y' * 5000 + ' end', 'ʰ' * 3000 + 'Σ' + "'" * 50 + 'Α ' + 'z' * 999]:
+        for chunk_size in (1, 7, 64):
+            assert list(iter_words(io.StringIO(text), chunk_size)) == words_at_once(text)
+
+def test_long_word_stays_linear():
+    text = 'a' * (8 << 20)
+    start = time.perf_counter()
+    words = list(iter_words(io.StringIO(text), 4096))
+    assert words == [text]
+    assert time.perf_counter() - start < 5  # Rescanning the carried word every chunk took minutes
@@ -0,0 +1,39 @@
+import os
+
+from plagiarism_archive import RECORD_HEADER, SubmissionArchive
+
+def test_matches_earlier_submissions(tmp_path):
+    with SubmissionArchive(tmp_path) as archive:
+        archive.add('e1', {'the', 'cat', 'sat', 'down'})
+        archive.add('e2', {'a', 'dog', 'ran', 'off'})
+        assert archive.check({'the', 'cat', 'sat', 'up'}) == [('e1', 60.0)]
+
+def test_reopen_replays_logs(tmp_path):
+    with SubmissionArchive(tmp_path) as archive:
+        archive.add('e1', {'the', 'cat', 'sat'})
+    with SubmissionArchive(tmp_path) as archive:
+        assert archive.names == ['e1']
+        assert archive.check({'the', 'cat', 'sat'}) == [('e1', 100.0)]
+
+def test_torn_record_is_cut_off(tmp_path):
+    with SubmissionArchive(tmp_path) as archive:
+        archive.add('e1', {'the', 'cat', 'sat'})
+    with open(os.path.join(tmp_path, 'essays.log'), 'ab') as file:
+        file.write(RECORD_HEADER.pack(10, 3) + b'bro')  # Header and part of a name, then a crash
+    with SubmissionArchive(tmp_path) as archive:
+        assert archive.names == ['e1']
+        archive.add('e2', {'the', 'dog'})
+    with SubmissionArchive(tmp_path) as archive:
+        assert archive.names == ['e1', 'e2']
+        assert archive.check({'the', 'dog'}) == [('e2', 100.0)]
+
+def test_torn_word_is_cut_off(tmp_path):
+    with SubmissionArchive(tmp_path) as archive:
+        archive.add('e1', {'cat'})
+    with open(os.path.join(tmp_path, 'words.txt'), 'a', encoding='utf-8') as file:
+        file.write('do')  # Word without its newline
+    with SubmissionArchive(tmp_path) as archive:
+        archive.add('e2', {'cat', 'sun'})
+    with SubmissionArchive(tmp_path) as archive:
+        assert set(archive.vocabulary.decode(archive.essays[1])) == {'cat', 'sun'}
+        assert 'do' not in archive.vocabulary.ids and 'dosun' not in archive.vocabulary.ids
@@ -0,0 +1,78 @@
+import os
+
+import pytest
+
+import plagiarism_cache
+from plagiarism_cache import TokenCache, pack_words
+
+@pytest.fixture
+def tokenized(monkeypatch):
+    """Records the files TokenCache actually tokenizes."""
+    calls, original = [], plagiarism_cache.read_essay
+    def read_essay(filename):
+        calls.append(os.path.basename(filename))
+        return original(filename)
+    monkeypatch.setattr(plagiarism_cache, 'read_essay', read_essay)
+    return calls
+
+def write(path, text, mtime_ns=None):
+    path.write_text(text, encoding='utf-8')
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+    return str(path)
+
+def cached_paths(cache):
+    return {os.path.basename(path) for path, in cache.connection.execute('SELECT path FROM essays')}
+
+def test_unchanged_file_is_read_from_the_cache(tmp_path, tokenized):
+    essay = write(tmp_path / 'a.txt', 'The cat sat, the cat ran.')
+    with TokenCache(str(tmp_path / 'cache.sqlite3')) as cache:
+        assert cache.read_essay(essay) == {'the', 'cat', 'sat', 'ran'}
+        assert cache.read_essay(essay) == {'the', 'cat', 'sat', 'ran'}
+    with TokenCache(str(tmp_path / 'cache.sqlite3')) as cache:
+        assert cache.read_essay(essay) == {'the', 'cat', 'sat', 'ran'}
+    assert tokenized == ['a.txt']
+
+def test_touched_file_is_matched_by_its_digest(tmp_path, tokenized):
+    essay = write(tmp_path / 'a.txt', 'alpha beta', mtime_ns=1_000_000_000)
+    with TokenCache(str(tmp_path / 'cache.sqlite3')) as cache:
+        cache.read_essay(essay)
+        os.utime(essay, ns=(5_000_000_000, 5_000_000_000))
+        assert cache.read_essay(essay) == {'alpha', 'beta'}
+        stored = cache.connection.execute('SELECT mtime_ns FROM essays').fetchone()[0]
+    assert tokenized == ['a.txt']
+    assert stored == 5_000_000_000  # The next read takes the fast (size, mtime) path again
+
+def test_changed_contents_are_tokenized_again(tmp_path, tokenized):
+    essay = write(tmp_path / 'a.txt', 'alpha beta', mtime_ns=1_000_000_000)
+    with TokenCache(str(tmp_path / 'cache.sqlite3')) as cache:
+        cache.read_essay(essay)
+        write(tmp_path / 'a.txt', 'gamma delt', mtime_ns=2_000_000_000)  # Same size, new words
+        assert cache.read_essay(essay) == {'gamma', 'delt'}
+        write(tmp_path / 'a.txt', 'epsilon', mtime_ns=3_000_000_000)
+        assert cache.read_essay(essay) == {'epsilon'}
+        assert cache.total_bytes == len(pack_words({'epsilon'}))
+    assert tokenized == ['a.txt'] * 3
+
+def test_least_recently_used_entries_are_evicted(tmp_path, tokenized):
+    texts = {'a.txt': 'apple apricot', 'b.txt': 'banana blueberry', 'c.txt': 'cherry coconut'}
+    essays = {name: write(tmp_path / name, text) for name, text in texts.items()}
+    sizes = {name: len(pack_words(set(text.split()))) for name, text in texts.items()}
+    with TokenCache(str(tmp_path / 'cache.sqlite3'), max_bytes=sum(sizes.values()) - 1) as cache:
+        for name in ['a.txt', 'b.txt', 'a.txt']:
+            cache.read_essay(essays[name])
+        assert cached_paths(cache) == {'a.txt', 'b.txt'}
+        cache.read_essay(essays['c.txt'])  # Only two fit, and b was used least recently
+        assert cached_paths(cache) == {'a.txt', 'c.txt'}
+        assert cache.total_bytes == sizes['a.txt'] + sizes['c.txt']
+        cache.read_essay(essays['b.txt'])
+        assert cached_paths(cache) == {'b.txt', 'c.txt'}
+    assert tokenized == ['a.txt', 'b.txt', 'c.txt', 'b.txt']
+
+def test_entry_over_the_limit_is_kept_alone(tmp_path, tokenized):
+    first = write(tmp_path / 'a.txt', 'apple')
+    second = write(tmp_path / 'b.txt', 'banana blueberry')
+    with TokenCache(str(tmp_path / 'cache.sqlite3'), max_bytes=1) as cache:
+        cache.read_essay(first)
+        cache.read_essay(second)
+        assert cached_paths(cache) == {'b.txt'}
@@ -0,0 +1,22 @@
+from plagiarism_index import PositionalIndex
+
+def make_index(tmp_path):
+    essay = tmp_path / 'essay.txt'
+    essay.write_text("The cat sat.\nDon't stop, the cat said.\n", encoding='utf-8')
+    index = PositionalIndex(str(tmp_path / 'index.sqlite3'))
+    index.add_essays([str(essay)])
+    return index, str(essay)
+
+def test_search_tokenizes_like_the_index(tmp_path):
+    with make_index(tmp_path)[0] as index:
+        results = index.search(['Cat,', "don't"])
+        assert list(results) == ['cat', 'don', 't']
+        assert [count for _, count, _ in results['cat']] == [2]
+
+def test_search_phrase_ignores_punctuation(tmp_path):
+    index, essay = make_index(tmp_path)
+    with index:
+        assert index.search_phrase('cat sat.') == [(essay, [(1, 1)])]
+        assert index.search_phrase("don't stop, the CAT") == [(essay, [(3, 2)])]
+        assert index.search_phrase('sat. Don') == [(essay, [(2, 1)])]  # Phrases run across lines
+        assert index.search_phrase('...') == []
@@ -0,0 +1,12 @@
+from plagiarism_ingest import load_essays, to_word_set
+
+def test_load_essays_accepts_a_generator(tmp_path):
+    paths = []
+    for name, text in [('a.txt', 'The cat sat.'), ('b.txt', 'A dog ran.')]:
+        path = tmp_path / name
+        path.write_text(text, encoding='utf-8')
+        paths.append(str(path))
+    vocabulary, essays, errors = load_essays((path for path in paths), workers=1)
+    assert errors == []
+    assert [name for name, _ in essays] == paths
+    assert to_word_set(essays[1][1], vocabulary) == {'a', 'dog', 'ran'}
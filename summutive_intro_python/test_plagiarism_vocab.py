@@ -0,0 +1,20 @@
+import random
+from array import array
+
+from plagiarism_vocab import InternedEssay, calculate_plagiarism, intern_corpus
+
+def test_scores_match_word_sets(engine):
+    rng = random.Random(8)
+    corpus = {f'essay{i}': {f'w{rng.randrange(400)}' for _ in range(rng.randint(0, 120))} for i in range(30)}
+    _, essays = intern_corpus(corpus)
+    for first in essays:
+        for second in essays:
+            words1, words2 = corpus[first.name], corpus[second.name]
+            union = words1 | words2
+            expected = (len(words1 & words2) / len(union)) * 100 if union else 0
+            assert calculate_plagiarism(first, second) == expected
+
+def test_large_word_ids(engine):
+    first = InternedEssay('first', array('I', [5, 70_000, 4_000_000_000]))
+    second = InternedEssay('second', array('I', [5, 4_000_000_000]))
+    assert calculate_plagiarism(first, second) == (2 / 3) * 100
@@ -0,0 +1,72 @@
+import contextlib
+import importlib.util
+import io
+import math
+import os
+import random
+
+import pytest
+
+import test2
+from running_sum import RunningSum
+
+LAB_FILE = os.path.join(os.path.dirname(__file__), "i.muvunyi@alustudent.com_lab-1.py")
+
+
+def load_lab():
+    spec = importlib.util.spec_from_file_location("lab_1", LAB_FILE)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_running_sum_matches_fsum():
+    rng = random.Random(14)
+    total, values = RunningSum(), []
+    for _ in range(5000):
+        if values and rng.random() < 0.4:
+            value = values.pop(rng.randrange(len(values)))
+            total.subtract(value)
+        else:
+            value = rng.choice([rng.uniform(0, 100), 1e16, 1e-16, 0.1, 1 / 3])
+            values.append(value)
+            total.add(value)
+        assert total.value() == math.fsum(values)
+
+
+# calculate_fin_grade from the running totals against the same sums taken over the assignments
+def recomputed(calculator):
+    by_category = {"FA": [], "SA": []}
+    for assignment in calculator.assignments:
+        by_category[assignment.ass_cat].append(assignment)
+    if not by_category["FA"] or not by_category["SA"]:
+        return None, None, None, None
+    scores = {category: math.fsum(a.weighted_score() for a in rows) for category, rows in by_category.items()}
+    weights = {category: math.fsum(a.weight for a in rows) for category, rows in by_category.items()}
+    total_weight = math.fsum(a.weight for a in calculator.assignments)
+    overall = (math.fsum(a.weighted_score() for a in calculator.assignments) / total_weight) * 100 if total_weight > 0 else 0
+    formative = (scores["FA"] / weights["FA"]) * 100 if weights["FA"] > 0 else 0
+    summative = (scores["SA"] / weights["SA"]) * 100 if weights["SA"] > 0 else 0
+    return overall, formative, summative, calculator.convert_to_gpa(overall)
+
+
+@pytest.mark.parametrize("module", ["test2", "lab-1"])
+def test_running_totals_match_recomputation(module):
+    calculator_class = (test2 if module == "test2" else load_lab()).StudentCalculatorGrade
+    rng = random.Random(5)
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(50):
+            calculator = calculator_class("amy", "C1")
+            for step in range(60):
+                action = rng.random()
+                name = f"a{rng.randint(0, 15)}"
+                category = rng.choice(["FA", "SA", "formative", "bad"])
+                weight, grade = rng.choice([rng.uniform(0, 20), 0.1, 7.5]), rng.uniform(0, 100)
+                if action < 0.5:
+                    calculator.add_assignment(name, category, weight, grade)
+                elif action < 0.8:
+                    calculator.update_assignment(name, category, weight, grade)
+                else:
+                    calculator.remove_assignment(name)
+                assert calculator.calculate_fin_grade() == recomputed(calculator)
+                assert calculator.total_weight == math.fsum(a.weight for a in calculator.assignments) <= 100
@@ -0,0 +1,102 @@
+import contextlib
+import csv
+import io
+import json
+import random
+
+import pytest
+
+import test1
+from transcript_writer import CSV_FIELDS, TranscriptWriter
+
+
+def write_transcripts(students, **options):
+    stream = io.StringIO()
+    with TranscriptWriter(stream, **options) as writer:
+        assert writer.write_all(students) == len(students)
+    return stream.getvalue()
+
+
+def test_text_matches_display_transcript(random_calculators):
+    rng = random.Random(17)
+    calculators = random_calculators(rng, 200, lambda: rng.uniform(0, 15), lambda: round(rng.uniform(0, 100), 2))
+    complete = [c for c in calculators if c.categories_present["FA"] and c.categories_present["SA"]]
+    assert len(complete) > 100
+    printed = io.StringIO()
+    with contextlib.redirect_stdout(printed):
+        for calculator in complete:
+            calculator.display_transcript()
+    assert write_transcripts(complete, batch_size=7) == printed.getvalue()
+
+
+def test_text_for_missing_category(random_calculators):
+    rng = random.Random(1)
+    (calculator,) = random_calculators(rng, 1, lambda: 10, lambda: 50, (0, 0))
+    calculator.add_assignment("quiz", "FA", 40, 80)
+    assert write_transcripts([calculator]).endswith("⚠️ Unable to display transcript due to missing grades.\n")
+
+
+def test_csv_and_json(random_calculators):
+    rng = random.Random(5)
+    calculators = random_calculators(rng, 50, lambda: rng.uniform(0, 15), lambda: rng.uniform(0, 100))
+    expected = []
+    for calculator in calculators:
+        if calculator.categories_present["FA"] and calculator.categories_present["SA"]:
+            overall_grade, _, _, gpa = calculator.calculate_fin_grade()
+        else:
+            overall_grade = gpa = None
+        expected.append((calculator, overall_grade, gpa))
+
+    rows = list(csv.DictReader(io.StringIO(write_transcripts(calculators, fmt="csv", batch_size=3))))
+    assert rows == [
+        dict(zip(CSV_FIELDS, map(str, [calculator.student_name, calculator.class_name, a.name, a.ass_cat,
+                                       a.grade, a.weight, "" if overall_grade is None else overall_grade,
+                                       "" if gpa is None else gpa])))
+        for calculator, overall_grade, gpa in expected
+        for a in calculator.assignments
+    ]
+
+    lines = write_transcripts(calculators, fmt="json").splitlines()
+    assert [json.loads(line) for line in lines] == [
+        {
+            "student_name": calculator.student_name,
+            "class_name": calculator.class_name,
+            "assignments": [{"ass_name": a.name, "ass_cat": a.ass_cat, "grade": a.grade, "weight": a.weight}
+                            for a in calculator.assignments],
+            "overall_grade": overall_grade,
+            "gpa": gpa,
+        }
+        for calculator, overall_grade, gpa in expected
+    ]
+
+
+def test_test1_students():
+    student = test1.Student("Amy")
+    student.add_assignment(test1.Assignment("quiz", "Formative", 80, 40))
+    student.add_assignment(test1.Assignment("exam", "Summative", 70, 30))
+    (record,) = map(json.loads, write_transcripts([student], fmt="json").splitlines())
+    assert record["student_name"] == "Amy" and record["class_name"] == ""
+    assert [a["ass_cat"] for a in record["assignments"]] == ["Formative", "Summative"]
+    assert record["overall_grade"] == student.calculate_scores()[2]
+
+
+# The heap selection must pick the same rows as a full sort, ties included
+@pytest.mark.parametrize("order", [None, "asc", "desc"])
+@pytest.mark.parametrize("top", [None, 0, 1, 3, 50])
+def test_top_and_order(order, top):
+    rng = random.Random(9)
+    writer = TranscriptWriter(io.StringIO(), order=order, top=top)
+    for _ in range(200):
+        rows = [(f"a{i}", "FA", rng.choice([10.0, 50.0, 72.5, 90.0]), 1.0) for i in range(rng.randint(0, 12))]
+        if order is None and top is None:
+            expected = rows  # Kept in the order they were entered
+        else:
+            expected = sorted(rows, key=lambda row: row[2], reverse=order != "asc")[:top]  # top alone means highest
+        assert writer.arrange(rows) == expected
+
+
+def test_bad_options():
+    with pytest.raises(ValueError):
+        TranscriptWriter(io.StringIO(), fmt="xml")
+    with pytest.raises(ValueError):
+        TranscriptWriter(io.StringIO(), order="up")
@@ -0,0 +1,129 @@
+import csv
+import heapq
+import io
+import json
+
+RED, YELLOW, GREEN, RESET = "\033[91m", "\033[93m", "\033[92m", "\033[0m"
+RULE = "-" * 50
+HEADER = f"\n{'Assignment':<15}{'Category':<15}{'Grade (%)':<12}{'Weight (%)'}\n{RULE}\n"
+CSV_FIELDS = ["student_name", "class_name", "ass_name", "ass_cat", "grade", "weight", "overall_grade", "gpa"]
+
+
+# Open a transcript file with a large write buffer
+def open_transcript_file(path, buffer_size=1 << 20):
+    return open(path, "w", encoding="utf-8", newline="", buffering=buffer_size)
+
+
+# Pull what a transcript needs out of a StudentCalculatorGrade or a test1.Student
+# Returns (student name, class name, [(assignment, category, grade, weight)], overall grade, GPA)
+def transcript_record(student):
+    if hasattr(student, "calculate_fin_grade"):
+        rows = [(a.name, a.ass_cat, a.grade, a.weight) for a in student.assignments]
+        # Skip calculate_fin_grade (and its warning) when a category is missing
+        if not student.categories_present["FA"] or not student.categories_present["SA"]:
+            return student.student_name, student.class_name, rows, None, None
+        overall_grade, _, _, gpa = student.calculate_fin_grade()
+        return student.student_name, student.class_name, rows, overall_grade, gpa
+    rows = [(a.name, a.assignment_type, a.score, a.weight) for a in student.assignments]
+    _, _, overall_grade, gpa, _ = student.calculate_scores()
+    return student.name, "", rows, overall_grade, gpa
+
+
+# Write many students' transcripts to one buffered stream as text, CSV or JSON lines
+class TranscriptWriter:
+    def __init__(self, file, fmt="text", colour=False, order=None, top=None, batch_size=1000):
+        if fmt not in ("text", "csv", "json"):
+            raise ValueError("Format must be 'text', 'csv' or 'json'.")
+        if order not in (None, "asc", "desc"):
+            raise ValueError("Order must be None, 'asc' or 'desc'.")
+        self.file = file
+        self.fmt = fmt
+        self.colour = colour
+        self.order = order  # None keeps the order assignments were entered in
+        self.top = top  # Only the top (or bottom, with order='asc') k assignments by grade
+        self.batch_size = batch_size
+        self.pending = []  # Rendered transcripts waiting for the next write
+        self.count = 0
+        if fmt == "csv":
+            self.csv_buffer = io.StringIO()
+            self.csv_writer = csv.writer(self.csv_buffer)
+            self.csv_writer.writerow(CSV_FIELDS)
+            self.flush_csv()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.flush()
+        self.file.flush()
+
+    # Put the assignment rows in the requested order
+    def arrange(self, rows):
+        if self.top is not None:
+            pick = heapq.nsmallest if self.order == "asc" else heapq.nlargest
+            return pick(self.top, rows, key=lambda row: row[2])  # O(n log k) instead of a full sort
+        if self.order is not None:
+            return sorted(rows, key=lambda row: row[2], reverse=self.order == "desc")
+        return rows
+
+    # Add one student's transcript to the stream
+    def write(self, student):
+        student_name, class_name, rows, overall_grade, gpa = transcript_record(student)
+        rows = self.arrange(rows)
+        if self.fmt == "text":
+            self.pending.append(self.render_text(student_name, class_name, rows, overall_grade, gpa))
+        elif self.fmt == "json":
+            self.pending.append(json.dumps({
+                "student_name": student_name,
+                "class_name": class_name,
+                "assignments": [
+                    {"ass_name": name, "ass_cat": category, "grade": grade, "weight": weight}
+                    for name, category, grade, weight in rows
+                ],
+                "overall_grade": overall_grade,
+                "gpa": gpa,
+            }) + "\n")
+        else:
+            for name, category, grade, weight in rows:
+                self.csv_writer.writerow([student_name, class_name, name, category, grade, weight, overall_grade, gpa])
+        self.count += 1
+        if self.count % self.batch_size == 0:
+            self.flush()
+
+    # Add many students' transcripts and return how many were written
+    def write_all(self, students):
+        start = self.count
+        for student in students:
+            self.write(student)
+        self.flush()
+        return self.count - start
+
+    def render_text(self, student_name, class_name, rows, overall_grade, gpa):
+        parts = [f"\n📜 Transcript\nStudent Name: {student_name} \nCohort: {class_name}\n"]
+        if overall_grade is None:
+            parts.append("⚠️ Unable to display transcript due to missing grades.\n")
+            return "".join(parts)
+        parts.append(HEADER)
+        for name, category, grade, weight in rows:
+            parts.append(f"{name:<15}{category:<15}{grade:<12.2f}{weight:.2f}\n")
+        parts.append(f"{RULE}\n{'Overall Grade':<30}{overall_grade:.2f}%\n")
+        if self.colour:
+            # Same colours as show_results
+            gpa_color = RED if gpa <= 2.0 else YELLOW if gpa <= 3.0 else GREEN
+            parts.append(f"{'GPA':<30}{gpa_color}{gpa:.2f}{RESET}\n{RULE}\n")
+        else:
+            parts.append(f"{'GPA':<30}{gpa:.2f}\n{RULE}\n")
+        return "".join(parts)
+
+    def flush_csv(self):
+        self.pending.append(self.csv_buffer.getvalue())
+        self.csv_buffer.seek(0)
+        self.csv_buffer.truncate()
+
+    # Write everything rendered so far in a single call
+    def flush(self):
+        if self.fmt == "csv":
+            self.flush_csv()
+        if self.pending:
+            self.file.write("".join(self.pending))
+            self.pending.clear()